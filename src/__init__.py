@@ -12,31 +12,32 @@ for details on the GameTime license and authors.
 """
 
 
-import analyzer
-import cilHelper
-import configuration
+import importlib
+import sys
+from types import ModuleType
+
 import defaults
-import fileHelper
 import gametimeError
-import indexExpression
-import inliner
-import loopHandler
-import merger
-import nxHelper
-import path
-import phoenixHelper
-import projectConfiguration
-import pulpHelper
-import simulators
-import smt
-import updateChecker
-
-from analyzer import Analyzer
+
 from defaults import logger
 from gametimeError import GameTimeError
 from pathGenerator import PathType
 
 
+#: Submodules of the GameTime module that are only imported the first
+#: time that they are accessed as attributes of the module.
+_LAZY_SUBMODULES = frozenset([
+    "analyzer", "cilHelper", "configuration", "fileHelper",
+    "indexExpression", "inliner", "loopHandler", "merger", "nxHelper",
+    "path", "phoenixHelper", "projectConfiguration", "pulpHelper",
+    "simulators", "smt", "updateChecker"
+])
+
+#: Dictionary that maps the names that the GameTime module re-exports
+#: lazily to the names of the submodules that define them.
+_LAZY_ATTRIBUTES = {"Analyzer": "analyzer"}
+
+
 class GameTime(object):
     """Contains methods and variables that allow a user to import
     GameTime as a module.
@@ -53,6 +54,7 @@ class GameTime(object):
             :class:`~gametime.analyzer.Analyzer` object for the project
             configuration provided.
         """
+        from analyzer import Analyzer
         try:
             analyzer = Analyzer(projectConfig)
             analyzer.createDag()
@@ -60,3 +62,34 @@ class GameTime(object):
         except GameTimeError as e:
             logger.error(str(e))
             raise e
+
+
+class _LazyModule(ModuleType):
+    """Stands in for the GameTime module in :data:`sys.modules`, and
+    imports the submodules of the GameTime module, and the names that
+    the module re-exports from them, only when they are first accessed.
+    This keeps ``import gametime`` from loading every submodule, and
+    their third-party dependencies, up front.
+    """
+    def __init__(self, module):
+        ModuleType.__init__(self, module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+
+        #: Original GameTime module, whose globals are used by the
+        #: functions defined in it, and which Python 2 would otherwise
+        #: clear once the module is removed from :data:`sys.modules`.
+        self._module = module
+
+    def __getattr__(self, name):
+        if name in _LAZY_SUBMODULES:
+            value = importlib.import_module("%s.%s" % (self.__name__, name))
+        elif name in _LAZY_ATTRIBUTES:
+            submodule = getattr(self, _LAZY_ATTRIBUTES[name])
+            value = getattr(submodule, name)
+        else:
+            raise AttributeError("'module' object has no attribute '%s'" %
+                                 name)
+        setattr(self, name, value)
+        return value
+
+sys.modules[__name__] = _LazyModule(sys.modules[__name__])
@@ -19,6 +19,7 @@ import random
 import shutil
 import time
 from copy import deepcopy
+from operator import attrgetter
 
 from numpy import dot, exp, eye, genfromtxt, savetxt
 from numpy.linalg import det, inv, slogdet
@@ -1251,11 +1252,12 @@ class Analyzer(object):
             raise GameTimeError(errMsg)
         else:
             with pathValuesFileHandler:
-                for position, path in enumerate(paths):
-                    pathValue = (path.measuredValue if measured else
-                                 path.predictedValue)
-                    pathValuesFileHandler.write("%d\t%d\n" %
-                                                (position+1, pathValue))
+                getValue = attrgetter("measuredValue" if measured
+                                      else "predictedValue")
+                pathValuesFileHandler.write("".join(
+                    "%d\t%d\n" % (position+1, getValue(path))
+                    for position, path in enumerate(paths)
+                ))
 
     @staticmethod
     def writeValueToFile(value, location):
@@ -1293,7 +1295,11 @@ class Analyzer(object):
             raise GameTimeError(errMsg)
         else:
             with analyzerFileHandler:
-                pickle.dump(self, analyzerFileHandler)
+                # The binary protocol is considerably faster to write and
+                # read than the default text protocol, and produces
+                # smaller files; loading detects the protocol used.
+                pickle.dump(self, analyzerFileHandler,
+                            pickle.HIGHEST_PROTOCOL)
                 logger.info("Analyzer object saved.")
 
     @staticmethod
@@ -1354,6 +1360,10 @@ class Analyzer(object):
         """
         rootDir = rootDir or self.projectConfig.locationTempDir
 
+        # Locations of the directories that have already been created
+        # by this method, so that each is only created once.
+        createdDirs = set()
+
         def generateLocation(infoType):
             """Helper function that returns the location of the file where
             the provided type of information (about a Path object) will be
@@ -1366,7 +1376,9 @@ class Analyzer(object):
             infoDir = os.path.join(rootDir,
                                    ("%s-%s" % (config.TEMP_CASE, pathNum + 1))
                                    if writePerPath else infoType)
-            createDir(infoDir)
+            if infoDir not in createdDirs:
+                createDir(infoDir)
+                createdDirs.add(infoDir)
             infoFile = os.path.join(infoDir,
                                     "%s%s" % (infoType,
                                               ("" if writePerPath
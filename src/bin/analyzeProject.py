@@ -20,18 +20,169 @@ for details on the GameTime license and authors.
 
 
 import argparse
+import hashlib
 import os
+import pickle
+from tempfile import NamedTemporaryFile
+from xml.dom import minidom
+from xml.parsers.expat import ExpatError
 
 from gametime import Analyzer, GameTime, GameTimeError, PathType
 from gametime.defaults import logger, sourceDir, config
 from gametime.interval import Interval
 from gametime.fileHelper import createDir
-from gametime.histogram import writeHistogramToFile
 from gametime.projectConfiguration import readProjectConfigFile
-from gametime.simulators.simulator import Simulator
 
+if False:
+    # These names are only used in the type comments of this script,
+    # and are only imported by type checkers.
+    from typing import List, Optional, Tuple
 
-def generateBasisPaths(projectConfig, analyzerLocation):
+    import numpy as np
+
+    from gametime.path import Path
+    from gametime.projectConfiguration import ProjectConfiguration
+    from gametime.simulators.simulator import Simulator
+
+
+class _AnalyzerSession(object):
+    """Context manager that keeps a single :class:`~gametime.analyzer.Analyzer`
+    object in memory across the different stages of an analysis, so that
+    the object is loaded from, and saved to, its file at most once.
+
+    The object is loaded lazily, the first time that the attribute
+    `analyzer` is read, unless a new object has already been assigned
+    to this attribute. On exit, the object is saved back to the file
+    only if it was assigned, or if it was marked as modified.
+    """
+
+    def __init__(self, analyzerLocation):
+        #: Location where the :class:`~gametime.analyzer.Analyzer` object
+        #: is saved and loaded from.
+        self.analyzerLocation = analyzerLocation
+
+        #: `True` if, and only if, the :class:`~gametime.analyzer.Analyzer`
+        #: object has changed since it was loaded, and thus needs to be
+        #: saved when the session ends.
+        self.modified = False
+
+        self._analyzer = None
+
+    @property
+    def analyzer(self):
+        """:class:`~gametime.analyzer.Analyzer` object of this session."""
+        if self._analyzer is None:
+            self._analyzer = Analyzer.loadFromFile(self.analyzerLocation)
+        return self._analyzer
+
+    @analyzer.setter
+    def analyzer(self, analyzer):
+        self._analyzer = analyzer
+        self.modified = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if self._analyzer is not None and self.modified:
+            self._analyzer.saveToFile(self.analyzerLocation)
+        return False
+
+
+#: Dictionary that maps the location of the directory that contains
+#: the code being analyzed to the location of the temporary directory
+#: called `analysis` created within it.
+_analysisDirs = {}
+
+def _getAnalysisDir(projectConfig):
+    """
+    Arguments:
+        projectConfig:
+            :class:`~gametime.projectConfiguration.ProjectConfiguration`
+            object that represents the configuration of a GameTime project.
+
+    Returns:
+        Location of the temporary directory called `analysis`, within
+        the directory that contains the code being analyzed.
+    """
+    origDir = projectConfig.locationOrigDir
+    analysisDir = _analysisDirs.get(origDir)
+    if analysisDir is None:
+        analysisDir = os.path.join(origDir, "analysis")
+        _analysisDirs[origDir] = analysisDir
+    return analysisDir
+
+#: Set of the locations of the temporary directories called `analysis`
+#: that have already been created.
+_createdAnalysisDirs = set()
+
+def _createAnalysisDir(projectConfig):
+    """Creates the temporary directory called `analysis`, within
+    the directory that contains the code being analyzed, if it has
+    not already been created.
+
+    Arguments:
+        projectConfig:
+            :class:`~gametime.projectConfiguration.ProjectConfiguration`
+            object that represents the configuration of a GameTime project.
+
+    Returns:
+        Location of the temporary directory called `analysis`.
+    """
+    analysisDir = _getAnalysisDir(projectConfig)
+    if analysisDir not in _createdAnalysisDirs:
+        createDir(analysisDir)
+        _createdAnalysisDirs.add(analysisDir)
+    return analysisDir
+
+def _getBasisCacheLocation(projectConfig):
+    """
+    Arguments:
+        projectConfig:
+            :class:`~gametime.projectConfiguration.ProjectConfiguration`
+            object that represents the configuration of a GameTime project.
+
+    Returns:
+        Location of the file that caches
+        the :class:`~gametime.analyzer.Analyzer` object, saved right after
+        the basis paths of the code specified in the project configuration
+        provided were generated. The name of the file is a hash of
+        the version of GameTime, the settings of the project configuration,
+        the code being analyzed, any files merged with this code and,
+        if loops are unrolled, the loop configuration file, so that
+        a change to any of these uses a different file.
+    """
+    hasher = hashlib.sha1()
+    hasher.update(config.VERSION)
+    hasher.update(repr((
+        projectConfig.func, projectConfig.startLabel, projectConfig.endLabel,
+        projectConfig.included, projectConfig.inlined,
+        projectConfig.UNROLL_LOOPS, projectConfig.RANDOMIZE_INITIAL_BASIS,
+        projectConfig.MAXIMUM_ERROR_SCALE_FACTOR,
+        projectConfig.DETERMINANT_THRESHOLD,
+        projectConfig.MAX_INFEASIBLE_PATHS,
+        projectConfig.MODEL_AS_NESTED_ARRAYS,
+        projectConfig.PREVENT_BASIS_REFINEMENT,
+        projectConfig.OVER_COMPLETE_BASIS,
+        str(projectConfig.smtSolver),
+        projectConfig.ilpSolver.__class__.__name__
+    )))
+
+    inputFiles = [projectConfig.locationOrigFile] + projectConfig.merged
+    if projectConfig.UNROLL_LOOPS:
+        inputFiles.append(os.path.join(projectConfig.locationTempDir,
+                                       config.TEMP_LOOP_CONFIG))
+    for location in inputFiles:
+        hasher.update(location)
+        if os.path.isfile(location):
+            with open(location, "rb") as inputFileHandler:
+                hasher.update(inputFileHandler.read())
+
+    return os.path.join(_getAnalysisDir(projectConfig), "basis-cache",
+                        hasher.hexdigest())
+
+def generateBasisPaths(projectConfig, analyzerLocation, saveAnalyzer=True,
+                       useCache=False):
     """Demonstrates how to generate the :class:`~gametime.path.Path` objects
     that represent the basis paths of the code specified in a GameTime project
     configuration, represented by a
@@ -43,6 +194,11 @@ def generateBasisPaths(projectConfig, analyzerLocation):
     The :class:`~gametime.analyzer.Analyzer` object that is used for analysis
     is saved to the location provided.
 
+    If requested, the :class:`~gametime.analyzer.Analyzer` object is also
+    cached in the temporary directory called `analysis`, and is reused by
+    later calls for the same, unchanged project, which thus skip
+    the generation of the basis paths altogether.
+
     Arguments:
         projectConfig:
             :class:`~gametime.projectConfiguration.ProjectConfiguration`
@@ -50,30 +206,60 @@ def generateBasisPaths(projectConfig, analyzerLocation):
         analyzerLocation:
             Location where the :class:`~gametime.analyzer.Analyzer` object
             will be saved.
-    """
-    # Create a new :class:`~gametime.analyzer.Analyzer` object 
-    # for this analysis.
-    analyzer = GameTime.analyze(projectConfig)
+        saveAnalyzer:
+            `True` if, and only if, the :class:`~gametime.analyzer.Analyzer`
+            object should be saved to the location provided before
+            this function returns.
+        useCache:
+            `True` if, and only if, the cache of basis paths
+            should be used, as described.
 
-    # Generate a list of the :class:`~gametime.path.Path` objects that
-    # represent the basis paths of the code specified in the XML file.
-    basisPaths = analyzer.generateBasisPaths()
+    Returns:
+        :class:`~gametime.analyzer.Analyzer` object used for the analysis.
+    """
+    cacheLocation = _getBasisCacheLocation(projectConfig) if useCache else None
+    if cacheLocation is not None and os.path.exists(cacheLocation):
+        # Reuse the :class:`~gametime.analyzer.Analyzer` object saved
+        # after the basis paths of this project were last generated.
+        logger.info("Reusing the basis paths cached at %s." % cacheLocation)
+        analyzer = Analyzer.loadFromFile(cacheLocation)
+        basisPaths = analyzer.basisPaths
+    else:
+        # Create a new :class:`~gametime.analyzer.Analyzer` object
+        # for this analysis.
+        analyzer = GameTime.analyze(projectConfig)
+
+        # Generate a list of the :class:`~gametime.path.Path` objects that
+        # represent the basis paths of the code specified in the XML file.
+        basisPaths = analyzer.generateBasisPaths()
+
+        # Cache the analyzer, writing it to a temporary file first, so
+        # that an interrupted write never leaves a partial cache file.
+        if cacheLocation is not None:
+            createDir(os.path.dirname(cacheLocation))
+            tempCacheLocation = "%s.tmp" % cacheLocation
+            analyzer.saveToFile(tempCacheLocation)
+            os.rename(tempCacheLocation, cacheLocation)
 
     # To keep the filesystem clean, create a directory for the basis paths
     # within the temporary directory called `analysis`. Write
     # the information contained in the :class:`~gametime.path.Path` objects
     # to this directory.
-    analysisDir = os.path.join(projectConfig.locationOrigDir, "analysis")
+    analysisDir = _getAnalysisDir(projectConfig)
     basisDir = os.path.join(analysisDir, "basis")
     createDir(basisDir)
     analyzer.writePathsToFiles(paths=basisPaths, writePerPath=False,
                                rootDir=basisDir)
 
     # Save the analyzer for later use.
-    analyzer.saveToFile(analyzerLocation)
+    if saveAnalyzer:
+        analyzer.saveToFile(analyzerLocation)
+
+    return analyzer
 
 def generatePaths(projectConfig, analyzerLocation, basisValuesLocation,
-                  numPaths, pathType, interval, useObExtraction):
+                  numPaths, pathType, interval, useObExtraction,
+                  analyzer=None):
     """Demonstrates how to load an :class:`~gametime.analyzer.Analyzer`
     object, saved from a previous analysis, from a file, and how to load
     the values to be associated with the basis :class:`~gametime.path.Path`
@@ -102,7 +288,9 @@ def generatePaths(projectConfig, analyzerLocation, basisValuesLocation,
     Arguments:
         projectConfig:
             :class:`~gametime.projectConfiguration.ProjectConfiguration`
-            object that represents the configuration of a GameTime project.
+            object that represents the configuration of a GameTime project,
+            which should be the project that the saved analyzer was
+            created for.
         analyzerLocation:
             Location of the saved :class:`~gametime.analyzer.Analyzer` object.
         basisValuesLocation:
@@ -121,14 +309,20 @@ def generatePaths(projectConfig, analyzerLocation, basisValuesLocation,
         useObExtraction:
             Boolean value specifiying whether to use overcomplete basis
             extraction algorithm
+        analyzer:
+            :class:`~gametime.analyzer.Analyzer` object that is already
+            loaded in memory. If provided, this object is used instead of
+            the one saved at `analyzerLocation`, and it is not saved back.
 
     Returns:
         List of :class:`~gametime.path.Path` objects that represent
         the feasible paths generated.
     """ 
     # Load an :class:`~gametime.analyzer.Analyzer` object from
-    # a file saved from a previous analysis.
-    analyzer = Analyzer.loadFromFile(analyzerLocation)
+    # a file saved from a previous analysis, unless one is provided.
+    saveAnalyzer = analyzer is None
+    if saveAnalyzer:
+        analyzer = Analyzer.loadFromFile(analyzerLocation)
 
     # Load the values to be associated with the basis
     # :class:`~gametime.path.Path` objects from the file specified.
@@ -142,18 +336,18 @@ def generatePaths(projectConfig, analyzerLocation, basisValuesLocation,
     # To keep the filesystem clean, create a directory for these feasible
     # paths in the temporary directory called `analysis`. Write
     # the information contained in the :class:`~gametime.path.Path`
-    # objects to this directory.
-    projectConfig = analyzer.projectConfig
-    analysisDir = os.path.join(projectConfig.locationOrigDir, "analysis")
+    # objects to this directory. The project configuration provided
+    # describes the same project as the one that the analyzer was created
+    # for, so the analyzer's own copy does not need to be read back.
+    analysisDir = _getAnalysisDir(projectConfig)
 
-    pathsDirName = PathType.getDescription(pathType)
-    pathsDir = os.path.join(analysisDir, pathsDirName)
+    # Get a one-word description of the path type, which also
+    # names the directory for these feasible paths.
+    pathTypeDesc = PathType.getDescription(pathType)
+    pathsDir = os.path.join(analysisDir, pathTypeDesc)
     createDir(pathsDir)
     analyzer.writePathsToFiles(paths, writePerPath=False, rootDir=pathsDir)
 
-    # Get a one-word description of the path type.
-    pathTypeDesc = PathType.getDescription(pathType)
-
     # Construct the location of the file that will store
     # the predictions of the values of the feasible paths.
     # Write the predicted values to this file.
@@ -171,11 +365,13 @@ def generatePaths(projectConfig, analyzerLocation, basisValuesLocation,
             os.path.join(analysisDir, "error-scale-factor"))
 
     # Save the analyzer for later use.
-    analyzer.saveToFile(analyzerLocation)
+    if saveAnalyzer:
+        analyzer.saveToFile(analyzerLocation)
 
     return paths
 
-def measureBasisPaths(analyzerLocation, simulator):
+def measureBasisPaths(analyzerLocation, simulator, analyzer=None,
+                      numWorkers=1):
     """Demonstrates how to load an :class:`~gametime.analyzer.Analyzer` object,
     saved from a previous analysis, from a file, how to measure the values of
     the feasible basis paths, represented by :class:`~gametime.path.Path`
@@ -188,24 +384,33 @@ def measureBasisPaths(analyzerLocation, simulator):
             :class:`~gametime.simulators.Simulator` object that represents
             the simulator on which the values of the feasible basis paths
             will be measured.
+        analyzer:
+            :class:`~gametime.analyzer.Analyzer` object that is already
+            loaded in memory. If provided, this object is used instead of
+            the one saved at `analyzerLocation`, and it is not saved back.
+        numWorkers:
+            Number of processes that measure the values of
+            the feasible basis paths concurrently.
     """
     # Load an :class:`~gametime.analyzer.Analyzer` object
-    # from a file saved from a previous analysis.
-    analyzer = Analyzer.loadFromFile(analyzerLocation)
+    # from a file saved from a previous analysis, unless one is provided.
+    saveAnalyzer = analyzer is None
+    if saveAnalyzer:
+        analyzer = Analyzer.loadFromFile(analyzerLocation)
 
     # Construct the location of the file that will store
     # the measurements of the values of the feasible basis paths.
     # Perform the measurements and write the values to this file.
-    projectConfig = analyzer.projectConfig
-    analysisDir = os.path.join(projectConfig.locationOrigDir, "analysis")
+    analysisDir = _createAnalysisDir(analyzer.projectConfig)
     measuredValuesLocation = os.path.join(analysisDir, "measured-basis")
     simulator.writeMeasurementsToFile(measuredValuesLocation,
-                                      analyzer.basisPaths)
+                                      analyzer.basisPaths, numWorkers)
 
     # Save the analyzer for later use.
-    analyzer.saveToFile(analyzerLocation)
+    if saveAnalyzer:
+        analyzer.saveToFile(analyzerLocation)
 
-def measurePaths(projectConfig, simulator, paths, pathType):
+def measurePaths(projectConfig, simulator, paths, pathType, numWorkers=1):
     """Demonstrates how to measure the values of a list of feasible
     paths, represented by :class:`~gametime.path.Path` objects,
     on a simulator, and how to save these measured values to a file.
@@ -228,6 +433,9 @@ def measurePaths(projectConfig, simulator, paths, pathType):
             the :class:`~gametime.pathGenerator.PathType` class.
             The different types of paths are described in the documentation of
             the :class:`~gametime.pathGenerator.PathType` class.
+        numWorkers:
+            Number of processes that measure the values of
+            the feasible paths concurrently.
     """
     # Get a one-word description of the path type.
     pathTypeDesc = PathType.getDescription(pathType)
@@ -235,13 +443,57 @@ def measurePaths(projectConfig, simulator, paths, pathType):
     # Construct the location of the file that will store
     # the measurements of the values of the feasible paths.
     # Perform the measurements and write the values to this file.
-    analysisDir = os.path.join(projectConfig.locationOrigDir, "analysis")
+    analysisDir = _createAnalysisDir(projectConfig)
     measuredValuesFileName = "measured-%s" % pathTypeDesc
     measuredValuesLocation = os.path.join(analysisDir,
                                           measuredValuesFileName)
-    simulator.writeMeasurementsToFile(measuredValuesLocation, paths)
+    simulator.writeMeasurementsToFile(measuredValuesLocation, paths,
+                                      numWorkers)
+
+#: Template of the warning issued when path values lie outside of
+#: the bounds provided for the range of values of a histogram.
+_histogramWarnMsgTemplate = ("WARNING: There are %d paths whose values are %s "
+                             "than the %s bound provided. These paths will be "
+                             "ignored in the histogram creation.")
+
+#: Error message issued when the range of values of a histogram
+#: needs to be determined from an empty list of paths.
+_histogramEmptyErrMsg = ("Unable to determine the range of values "
+                         "for the histogram: no paths were provided.")
+
+def _scanPathValues(pathValues, lower=None, upper=None):
+    # type: (np.ndarray, Optional[float], Optional[float]) -> Tuple[Optional[float], Optional[float], int, int]
+    """Computes, in one pass over the array of path values provided,
+    the summary statistics needed to determine the range of values
+    for a histogram.
 
-def _getHistogramRange(paths, lower=None, upper=None, measured=False):
+    Arguments:
+        pathValues:
+            :class:`~numpy.ndarray` of the values of feasible paths.
+        lower:
+            Lower bound of the range of values for the histogram.
+        upper:
+            Upper bound of the range of values for the histogram.
+
+    Returns:
+        Tuple of four elements: the smallest value, the greatest value,
+        the number of values smaller than the lower bound provided, and
+        the number of values greater than the upper bound provided. The
+        first two elements are `None` if the array is empty, and the
+        counts are zero if the corresponding bound is not provided.
+    """
+    if pathValues.size == 0:
+        return (None, None, 0, 0)
+    smallest, greatest = float(pathValues.min()), float(pathValues.max())
+    numBelow = (int((pathValues < lower).sum())
+                if lower is not None and smallest < lower else 0)
+    numAbove = (int((pathValues > upper).sum())
+                if upper is not None and greatest > upper else 0)
+    return (smallest, greatest, numBelow, numAbove)
+
+def _getHistogramRange(paths, lower=None, upper=None, measured=False,
+                       pathValues=None):
+    # type: (List[Path], Optional[float], Optional[float], bool, Optional[np.ndarray]) -> Tuple[float, float]
     """Gets the range of values for the histogram that will be created
     from the values of the list of feasible paths provided, each of which
     is represented by a :class:`~gametime.path.Path` object.
@@ -267,41 +519,55 @@ def _getHistogramRange(paths, lower=None, upper=None, measured=False):
         measured:
             `True` if, and only if, the values that will be used for
             the histogram are the measured values of the feasible paths.
+        pathValues:
+            Array of the values of the feasible paths, as returned by
+            :func:`~gametime.histogram.extractPathValues`. If provided,
+            these values are used instead of being extracted again
+            from `paths`.
     Returns:
         Tuple whose first element is the lower bound of the range of values
         for the histogram and whose second element is the upper bound of
         values for the histogram.
     """
-    pathValues = [path.measuredValue if measured else path.predictedValue
-                  for path in paths]
-
-    warnMsgTemplate = ("WARNING: There are %d paths whose values are %s "
-                       "than the %s bound provided. These paths will be "
-                       "ignored in the histogram creation.")
-    if lower is not None:
-        smallerThanBound = sum([1 for value in pathValues if value < lower])
-        if smallerThanBound > 0:
-            warnMsg = warnMsgTemplate % (smallerThanBound, "smaller", "lower")
-            logger.warn(warnMsg)
-    if upper is not None:
-        greaterThanBound = sum([1 for value in pathValues if value > upper])
-        if greaterThanBound > 0:
-            warnMsg = warnMsgTemplate % (greaterThanBound, "greater", "upper")
-            logger.warn(warnMsg)
+    if pathValues is None:
+        from gametime.histogram import extractPathValues
+        pathValues = extractPathValues(paths, measured)
+
+    # In the common case where no bounds are provided, no value can lie
+    # outside of the range, which is simply that of the values themselves.
+    if lower is None and upper is None:
+        if pathValues.size == 0:
+            raise GameTimeError(_histogramEmptyErrMsg)
+        return (float(pathValues.min()), float(pathValues.max()))
+
+    smallest, greatest, smallerThanBound, greaterThanBound = \
+        _scanPathValues(pathValues, lower, upper)
+
+    warnMsgTemplate = _histogramWarnMsgTemplate
+    if smallerThanBound > 0:
+        warnMsg = warnMsgTemplate % (smallerThanBound, "smaller", "lower")
+        logger.warn(warnMsg)
+    if greaterThanBound > 0:
+        warnMsg = warnMsgTemplate % (greaterThanBound, "greater", "upper")
+        logger.warn(warnMsg)
 
     if lower is None or upper is None:
-        lower = lower or min(pathValues)
-        upper = upper or max(pathValues)
+        if smallest is None:
+            raise GameTimeError(_histogramEmptyErrMsg)
+        lower = lower or smallest
+        upper = upper or greatest
     elif lower is not None and upper is not None:
         lower, upper = sorted((lower, upper))
     return (lower, upper)
 
-def createHistogramForBasisPaths(analyzerLocation, numBins, lower, upper):
+def createHistogramForBasisPaths(analyzerLocation, numBins, lower, upper,
+                                 analyzer=None):
     """Demonstrates how to load an :class:`~gametime.analyzer.Analyzer` object,
     saved from a previous analysis, from a file, how to create a histogram
     from the measured values of the feasible basis paths, represented by
     :class:`~gametime.path.Path` objects, and how to save this histogram
-    to a file.
+    to a file. The :class:`~gametime.analyzer.Analyzer` object is only
+    read, and is thus not saved back to its file.
 
     Arguments:
         analyzerLocation:
@@ -312,28 +578,32 @@ def createHistogramForBasisPaths(analyzerLocation, numBins, lower, upper):
             Lower bound of the range of values for the histogram.
         upper:
             Upper bound of the range of values for the histogram.
+        analyzer:
+            :class:`~gametime.analyzer.Analyzer` object that is already
+            loaded in memory. If provided, this object is used instead of
+            the one saved at `analyzerLocation`.
     """
     # Load an :class:`~gametime.analyzer.Analyzer` object
-    # from a file saved from a previous analysis.
-    analyzer = Analyzer.loadFromFile(analyzerLocation)
+    # from a file saved from a previous analysis, unless one is provided.
+    if analyzer is None:
+        analyzer = Analyzer.loadFromFile(analyzerLocation)
     basisPaths = analyzer.basisPaths
 
     # Construct the location of the file that will store the histogram
     # created from the measured values of the feasible basis paths.
     # Create the histogram and write it to this file.
-    projectConfig = analyzer.projectConfig
-    analysisDir = os.path.join(projectConfig.locationOrigDir, "analysis")
+    analysisDir = _createAnalysisDir(analyzer.projectConfig)
     histogramLocation = os.path.join(analysisDir, "histogram-basis")
 
-    basisPaths = analyzer.basisPaths
-    range = _getHistogramRange(basisPaths, lower, upper, True)
-    writeHistogramToFile(histogramLocation, basisPaths, numBins, range, True)
-
-    # Save the analyzer for later use.
-    analyzer.saveToFile(analyzerLocation)
+    from gametime.histogram import extractPathValues, writeHistogramToFile
+    pathValues = extractPathValues(basisPaths, True)
+    histRange = _getHistogramRange(basisPaths, lower, upper, True, pathValues)
+    writeHistogramToFile(histogramLocation, basisPaths, numBins, histRange,
+                         True, pathValues)
 
 def createHistogramForPaths(projectConfig, paths, pathType,
-                            numBins, lower, upper, measured=False):
+                            numBins, lower, upper, measured=False,
+                            pathValues=None):
     """Demonstrates how to create a histogram from the values of
     feasible paths, and how to save this histogram to a file.
 
@@ -359,6 +629,11 @@ def createHistogramForPaths(projectConfig, paths, pathType,
         measured:
             `True` if, and only if, the values that will be used for
             the histogram are the measured values of the feasible paths.
+        pathValues:
+            Array of the values of the feasible paths, such as one
+            maintained by a :class:`~gametime.histogram.PathArray` object.
+            If provided, these values are used instead of being extracted
+            again from `paths`.
     """
     # Get a one-word description of the path type.
     pathTypeDesc = ("basis" if pathType is None
@@ -367,14 +642,37 @@ def createHistogramForPaths(projectConfig, paths, pathType,
     # Construct the location of the file that will store
     # the histogram created from the values of the feasible
     # paths. Create the histogram and write it to this file.
-    analysisDir = os.path.join(projectConfig.locationOrigDir, "analysis")
+    analysisDir = _createAnalysisDir(projectConfig)
     histogramFileName = ("histogram-%s-%s" %
                          ("measured" if measured else "predicted",
                           pathTypeDesc))
     histogramLocation = os.path.join(analysisDir, histogramFileName)
 
-    range = _getHistogramRange(paths, lower, upper, measured)
-    writeHistogramToFile(histogramLocation, paths, numBins, range, measured)
+    from gametime.histogram import extractPathValues, writeHistogramToFile
+    if pathValues is None:
+        pathValues = extractPathValues(paths, measured)
+    histRange = _getHistogramRange(paths, lower, upper, measured, pathValues)
+    writeHistogramToFile(histogramLocation, paths, numBins, histRange,
+                         measured, pathValues)
+
+# Help messages of the command-line arguments that are built from templates.
+# These are computed once, when this module is loaded.
+_pathDesc = "Generates %s feasible paths of the code under analysis%s."
+_allPathsWarning = (" (in %s order of value). WARNING: The total number of "
+                    "feasible paths can be very large")
+_worstCaseHelp = _pathDesc % ("the worst-case",
+                              " (paths with the largest values)")
+_bestCaseHelp = _pathDesc % ("the best-case",
+                             " (paths with the smallest values)")
+_randomHelp = _pathDesc % ("random", "")
+_allDecreasingHelp = _pathDesc % ("all", _allPathsWarning % "decreasing")
+_allIncreasingHelp = _pathDesc % ("all", _allPathsWarning % "increasing")
+
+_boundDesc = ("%s bound on the values of the feasible paths that are "
+              "generated. If this argument is not provided, no %s bound "
+              "is assumed.")
+_lowerHelp = _boundDesc % ("Lower", "lower")
+_upperHelp = _boundDesc % ("Upper", "upper")
 
 def _createArgParser():
     """
@@ -441,6 +739,17 @@ def _createArgParser():
               "the code to analyze.")
     )
 
+    basisGroup.add_argument(
+        "--basis-cache", action="store_true",
+        help=("Reuses the basis paths generated by a previous run, if "
+              "neither the code under analysis nor the project configuration "
+              "have changed since. The basis paths are cached in "
+              "a directory called `basis-cache`, created within "
+              "the temporary directory called `analysis`. Header files "
+              "are not checked for changes, and paths are not regenerated "
+              "even if the initial basis is randomized.")
+    )
+
     basisGroup.add_argument(
         "--overcomplete_basis", action="store_true",
         help=("Find overcomplete basis. The propertis of the overcomplete "
@@ -479,47 +788,29 @@ def _createArgParser():
               "The default value is %(default)s.")
     )
 
-    pathDesc = "Generates %s feasible paths of the code under analysis%s."
     feasibleGroup.add_argument(
-        "-w", "--worst-case", action="store_true",
-        help=pathDesc % ("the worst-case", " (paths with the largest values)")
+        "-w", "--worst-case", action="store_true", help=_worstCaseHelp
     )
     feasibleGroup.add_argument(
-        "-v", "--best-case", action="store_true",
-        help=pathDesc % ("the best-case", " (paths with the smallest values)")
+        "-v", "--best-case", action="store_true", help=_bestCaseHelp
     )
     feasibleGroup.add_argument(
-        "-r", "--random", action="store_true",
-        help=pathDesc % ("random", "")
+        "-r", "--random", action="store_true", help=_randomHelp
     )
     feasibleGroup.add_argument(
-        "-d", "--all-decreasing", action="store_true",
-        help=pathDesc % (
-            "all",
-            (" (in decreasing order of value). WARNING: The total number of "
-             "feasible paths can be very large")
-        )
+        "-d", "--all-decreasing", action="store_true", help=_allDecreasingHelp
     )
     feasibleGroup.add_argument(
-        "-i", "--all-increasing", action="store_true",
-        help=pathDesc % (
-            "all",
-            (" (in increasing order of value). WARNING: The total number of "
-             "feasible paths can be very large")
-        )
+        "-i", "--all-increasing", action="store_true", help=_allIncreasingHelp
     )
 
-    boundDesc = (
-        "%s bound on the values of the feasible paths that are generated. "
-        "If this argument is not provided, no %s bound is assumed."
-    )
     feasibleGroup.add_argument(
         "-l", "--lower", metavar="BOUND", type=float, default=None,
-        help=(boundDesc % ("Lower", "lower"))
+        help=_lowerHelp
     )
     feasibleGroup.add_argument(
         "-u", "--upper", metavar="BOUND", type=float, default=None,
-        help=(boundDesc % ("Upper", "upper"))
+        help=_upperHelp
     )
 
     measurementGroupTitle = ("Optional arguments for measurement of "
@@ -552,6 +843,14 @@ def _createArgParser():
               "case files on. The default simulator is %(default)s.")
     )
 
+    measurementGroup.add_argument(
+        "-j", "--jobs", metavar="NUM", type=int, default=1,
+        help=("Number of processes that measure the values of feasible paths "
+              "concurrently, such as the number of processor cores available. "
+              "The default value is %(default)s, which measures one path "
+              "at a time.")
+    )
+
     histogramGroupTitle = ("Optional arguments for creating histograms "
                            "from the values of feasible paths")
     histogramGroupDesc = (
@@ -606,6 +905,7 @@ def _createArgParser():
     return argParser
 
 def _findXmlFile(location):
+    # type: (str) -> Optional[str]
     """
     Arguments:
         location:
@@ -618,18 +918,154 @@ def _findXmlFile(location):
         XML file within the directory is returned. If no XML file can be found,
         this function returns `None`.
     """
-    _, extension = os.path.splitext(location)
-    if extension == ".xml":
+    # A location that already names an XML file is returned without
+    # accessing the file system.
+    if location.lower().endswith(".xml"):
         return os.path.normpath(location)
-    if os.path.exists(location) and os.path.isdir(location):
+    if os.path.isdir(location):
+        # Check the extension of each name before checking whether
+        # the entry is a file, so that only XML entries are stat-ed.
         for entry in os.listdir(location):
-            entry = os.path.normpath(os.path.join(location, entry))
-            if os.path.isfile(entry):
-                _, extension = os.path.splitext(entry)
-                if extension == ".xml":
+            if entry.lower().endswith(".xml"):
+                entry = os.path.normpath(os.path.join(location, entry))
+                if os.path.isfile(entry):
                     return entry
 
+def _getProjectConfigCacheLocation(location):
+    """
+    Arguments:
+        location:
+            Location of the XML file that contains project
+            configuration information.
+
+    Returns:
+        Location of the file that caches the
+        :class:`~gametime.projectConfiguration.ProjectConfiguration` object
+        read from the XML file provided, within the temporary directory
+        called `analysis` of the project, or None if the location of
+        the file to be analyzed cannot be read from the XML file.
+    """
+    # Only the location of the file to be analyzed is read, which is much
+    # cheaper than initializing a whole project configuration.
+    try:
+        projectConfigDom = minidom.parse(location)
+        fileNode = projectConfigDom.getElementsByTagName("file")[0]
+        locationNode = fileNode.getElementsByTagName("location")[0]
+    except (EnvironmentError, IndexError, ExpatError):
+        return None
+    locationFile = "".join(child.data for child in locationNode.childNodes
+                           if child.nodeType == child.TEXT_NODE).strip()
+    if not locationFile:
+        return None
+
+    projectConfigDir = os.path.dirname(os.path.abspath(location))
+    locationFile = os.path.normpath(os.path.join(projectConfigDir,
+                                                 locationFile))
+    return os.path.join(os.path.dirname(locationFile), "analysis",
+                        "%s.cache" % os.path.basename(location))
+
+def _isProjectConfigValid(projectConfig):
+    """
+    Arguments:
+        projectConfig:
+            :class:`~gametime.projectConfiguration.ProjectConfiguration`
+            object that represents the configuration of a GameTime project.
+
+    Returns:
+        True if the file to be analyzed, the included directories and
+        the merged files of the project configuration provided all still
+        exist; False otherwise.
+    """
+    return (os.path.isfile(projectConfig.locationOrigFile) and
+            all(os.path.isdir(includedDir)
+                for includedDir in projectConfig.included) and
+            all(os.path.isfile(mergedFile)
+                for mergedFile in projectConfig.merged))
+
+def _readProjectConfigFileCached(location):
+    """Reads project configuration information from the XML file provided,
+    reusing the :class:`~gametime.projectConfiguration.ProjectConfiguration`
+    object saved by a previous call if the XML file has not been modified
+    since, and if the files and directories that the object refers to
+    still exist. The object is saved to a file in the temporary directory
+    called `analysis` of the project.
+
+    Arguments:
+        location:
+            Location of the XML file that contains project
+            configuration information.
+
+    Returns:
+        :class:`~gametime.projectConfiguration.ProjectConfiguration` object
+        that contains information from the XML file whose location is provided.
+    """
+    if not os.path.isfile(location):
+        # Let the reader report the missing file.
+        return readProjectConfigFile(location)
+
+    cacheLocation = _getProjectConfigCacheLocation(location)
+    if cacheLocation is None:
+        # Let the reader report the malformed file.
+        return readProjectConfigFile(location)
+
+    xmlStat = os.stat(location)
+    cacheKey = (config.VERSION, xmlStat.st_mtime, xmlStat.st_size)
+
+    try:
+        with open(cacheLocation, "rb") as cacheFileHandler:
+            cachedKey, projectConfig = pickle.load(cacheFileHandler)
+    except (EnvironmentError, EOFError, AttributeError, ImportError,
+            IndexError, TypeError, ValueError, pickle.UnpicklingError):
+        cachedKey = None
+    if cachedKey == cacheKey and _isProjectConfigValid(projectConfig):
+        logger.info("Reusing the project configuration cached at %s." %
+                    cacheLocation)
+        # Reading the XML file creates the temporary directory
+        # of the project, so create it here as well.
+        createDir(projectConfig.locationTempDir)
+        return projectConfig
+
+    projectConfig = readProjectConfigFile(location)
+
+    # Write the cache to a temporary file that then replaces the cache,
+    # so that an interrupted or concurrent run never leaves behind
+    # a truncated cache.
+    tempLocation = None
+    try:
+        cacheDir = os.path.dirname(cacheLocation)
+        createDir(cacheDir)
+        with NamedTemporaryFile(dir=cacheDir, suffix=".tmp",
+                                delete=False) as cacheFileHandler:
+            tempLocation = cacheFileHandler.name
+            pickle.dump((cacheKey, projectConfig), cacheFileHandler,
+                        pickle.HIGHEST_PROTOCOL)
+        if os.name == "nt" and os.path.exists(cacheLocation):
+            # On Windows, a file cannot be renamed over an existing file.
+            os.remove(cacheLocation)
+        os.rename(tempLocation, cacheLocation)
+    except (EnvironmentError, GameTimeError, AttributeError, TypeError,
+            pickle.PicklingError) as e:
+        logger.warn("Unable to cache the project configuration at %s: %s" %
+                    (cacheLocation, e))
+        if tempLocation is not None and os.path.exists(tempLocation):
+            os.remove(tempLocation)
+    return projectConfig
+
+#: Dictionary that maps the name of a simulator to a tuple whose first
+#: element is the name of the module that contains the class of
+#: the simulator, and whose second element is the name of the class.
+_simulatorClasses = {
+    "ptarm": ("gametime.simulators.ptarmSimulator", "PtarmSimulator"),
+    "simit-arm": ("gametime.simulators.simItArmSimulator",
+                  "SimItArmSimulator"),
+}
+
+#: Dictionary that maps a tuple of the name of a simulator and
+#: a project configuration to the simulator created for them.
+_simulators = {}
+
 def _getSimulator(name, projectConfig):
+    # type: (str, ProjectConfiguration) -> Simulator
     """
     Arguments:
         name:
@@ -642,45 +1078,89 @@ def _getSimulator(name, projectConfig):
         :class:`~gametime.simulators.Simulator` object that represents
         the simulator whose name is provided.
     """
-    from gametime.simulators.ptarmSimulator import PtarmSimulator
-    from gametime.simulators.simItArmSimulator import SimItArmSimulator
-    return {
-        "ptarm": PtarmSimulator(projectConfig),
-        "simit-arm": SimItArmSimulator(projectConfig),
-    }[name]
-
-def main():
-    """Main function invoked when this script is run."""
-    argParser = _createArgParser()
-    args = argParser.parse_args()
-
-    argsAndPathTypes = [
-        (args.worst_case, PathType.WORST_CASE),
-        (args.best_case, PathType.BEST_CASE),
-        (args.random, PathType.RANDOM),
-        (args.all_decreasing, PathType.ALL_DECREASING),
-        (args.all_increasing, PathType.ALL_INCREASING)
-    ]
-    pathTypeArgs = [pathTypeArg for pathTypeArg, _ in argsAndPathTypes]
-    pathTypes = [pathType for _, pathType in argsAndPathTypes]
+    key = (name, projectConfig)
+    simulator = _simulators.get(key)
+    if simulator is None:
+        if name not in _simulatorClasses:
+            raise GameTimeError("Unknown simulator: %s" % name)
+        # Import only the module of the simulator requested, since each
+        # simulator module can pull in dependencies of its own.
+        moduleName, className = _simulatorClasses[name]
+        module = __import__(moduleName, fromlist=[className])
+        simulator = getattr(module, className)(projectConfig)
+        _simulators[key] = simulator
+    return simulator
+
+def _validateArgs(args, anyPathTypes):
+    """Checks that the command-line arguments provided are consistent
+    with each other, so that an invalid combination is reported before
+    any file is read or any analysis is performed.
 
+    Arguments:
+        args:
+            :class:`~argparse.Namespace` object that contains
+            the command-line arguments provided.
+        anyPathTypes:
+            `True` if, and only if, the generation of at least one type
+            of feasible paths, other than basis paths, is requested.
+    """
     # Require the use of new_extraction algorithm when used with overcomplete
     # basis
-    if ((args.overcomplete_basis and any(pathTypeArgs))
+    if ((args.overcomplete_basis and anyPathTypes)
         and not (args.ob_extraction)):
         raise GameTimeError("New extraction algorithm must be used when over "
                             "complete basis is requested")
+    if args.histogram and args.hist_bins <= 0:
+        raise GameTimeError("The number of bins in a histogram must be "
+                            "positive, but %d bins were requested." %
+                            args.hist_bins)
+    if args.measure_tests and args.jobs <= 0:
+        raise GameTimeError("The number of paths to measure at once must be "
+                            "positive, but %d was requested." % args.jobs)
+
+#: Tuple of pairs, each of which contains the name of a command-line
+#: argument that requests the generation of a type of feasible paths,
+#: and the type of feasible paths requested.
+_pathTypeArgNames = (
+    ("worst_case", PathType.WORST_CASE),
+    ("best_case", PathType.BEST_CASE),
+    ("random", PathType.RANDOM),
+    ("all_decreasing", PathType.ALL_DECREASING),
+    ("all_increasing", PathType.ALL_INCREASING)
+)
+
+def main(argv=None):
+    """Main function invoked when this script is run.
+
+    Arguments:
+        argv:
+            List of the command-line arguments to use, excluding the name
+            of the script. If not provided, the arguments that this script
+            was run with are used. Providing the arguments allows several
+            analyses to be run within one process, which then imports
+            the GameTime modules only once.
+    """
+    argParser = _createArgParser()
+    args = argParser.parse_args(argv)
+
+    # Determine the types of feasible paths whose generation is requested.
+    requestedPathTypes = [pathType for argName, pathType in _pathTypeArgNames
+                          if getattr(args, argName)]
+    anyPathTypes = bool(requestedPathTypes)
+
+    # Check the combination of arguments before any file is accessed.
+    _validateArgs(args, anyPathTypes)
 
     # Proceed only if either the generation of feasible paths, or
     # the measurement of the values of feasible paths, or the creation
     # of a histogram of path values has been requested.
-    if (not args.basis and not any(pathTypeArgs)
+    if (not args.basis and not anyPathTypes
         and not args.measure_tests and not args.histogram):
         return
 
     # Find the XML file that will be used to initialize the GameTime project.
-    workingDir = os.getcwd()
-    location = os.path.normpath(os.path.join(workingDir, args.analyze))
+    # Only relative locations are resolved against the working directory.
+    location = os.path.abspath(args.analyze)
     projectConfigXmlFile = _findXmlFile(location)
     if not projectConfigXmlFile:
         raise GameTimeError("No XML file for the configuration of "
@@ -690,17 +1170,17 @@ def main():
     # Initialize a :class:`~gametime.projectConfiguration.ProjectConfiguration`
     # object, which represents the configuration of a GameTime project, with
     # the contents of the XML file.
-    projectConfig = readProjectConfigFile(projectConfigXmlFile)
+    projectConfig = _readProjectConfigFileCached(projectConfigXmlFile)
     if args.unroll_loops:
         projectConfig.UNROLL_LOOPS = args.unroll_loops
 
     if args.overcomplete_basis:
         projectConfig.OVER_COMPLETE_BASIS = True
 
-    # Create a temporary directory called `analysis` in
-    # the directory that contains the code being analyzed.
-    analysisDir = os.path.join(projectConfig.locationOrigDir, "analysis")
-    createDir(analysisDir)
+    # Determine the location of the temporary directory called `analysis`
+    # in the directory that contains the code being analyzed. The directory
+    # is created by the first stage that writes to it.
+    analysisDir = _getAnalysisDir(projectConfig)
 
     # Determine the location where
     # the :class:`~gametime.analyzer.Analyzer` object used for
@@ -708,55 +1188,87 @@ def main():
     analyzerLocation = (args.analyzer_location or
                         os.path.join(analysisDir, "analyzer"))
 
-    # Generate the feasible basis paths, if requested.
-    if args.basis:
-        generateBasisPaths(projectConfig, analyzerLocation)
-
-    # If measurement of feasible paths is requested but no type has been
-    # provided, or the generation of feasible basis paths is also requested,
-    # measure the values of the feasible basis paths.
-    if (args.measure_tests and (args.basis or not any(pathTypeArgs))):
-        simulator = _getSimulator(args.simulator, projectConfig)
-        measureBasisPaths(analyzerLocation, simulator)
-
-    # If the creation of a histogram is requested but no type has been
-    # provided, or the generation of feasible basis paths is also requested,
-    # create a histogram from the values of the feasible basis paths.
-    if (args.histogram and (args.basis or not any(pathTypeArgs))):
-        createHistogramForBasisPaths(analyzerLocation, args.hist_bins,
-                                     args.hist_lower, args.hist_upper)
-
-    # Generate other types of feasible paths, if requested.
-    basisValuesLocation = (os.path.join(workingDir, args.values) if args.values
-                           else os.path.join(analysisDir, "measured-basis"))
-    numPaths = args.num_paths
-    interval = Interval(args.lower, args.upper)
-    useObExtraction = True if args.ob_extraction else False
-
-    for pathTypeArg, pathType in argsAndPathTypes:
-        if pathTypeArg:
-            paths = generatePaths(projectConfig, analyzerLocation,
-                                  basisValuesLocation, numPaths, pathType,
-                                  interval, useObExtraction)
-
-            # Create a histogram of the predicted values of
-            # the feasible paths generated, if requested.
-            if args.histogram:
-                createHistogramForPaths(projectConfig, paths, pathType,
-                                        args.hist_bins, args.hist_lower,
-                                        args.hist_upper)
-
-            # Measure the feasible paths generated, if requested.
-            if args.measure_tests:
-                simulator = _getSimulator(args.simulator, projectConfig)
-                measurePaths(projectConfig, simulator, paths, pathType)
-
-            # Create a histogram of the measured values of
-            # the feasible paths generated, if requested.
-            if args.measure_tests and args.histogram:
-                createHistogramForPaths(projectConfig, paths, pathType,
-                                        args.hist_bins, args.hist_lower,
-                                        args.hist_upper, measured=True)
+    # Import the modules needed by the histogram stages only if
+    # the creation of a histogram is requested.
+    if args.histogram:
+        from gametime.histogram import PathArray
+
+    # Create the simulator once, and share it among all of the stages
+    # that measure paths.
+    simulator = (_getSimulator(args.simulator, projectConfig)
+                 if args.measure_tests else None)
+
+    # Keep the :class:`~gametime.analyzer.Analyzer` object in memory
+    # across all of the requested stages, so that it is loaded from,
+    # and saved to, its file at most once.
+    with _AnalyzerSession(analyzerLocation) as session:
+        # Generate the feasible basis paths, if requested.
+        if args.basis:
+            session.analyzer = generateBasisPaths(
+                projectConfig, analyzerLocation, saveAnalyzer=False,
+                useCache=args.basis_cache)
+
+        # If measurement of feasible paths is requested but no type has
+        # been provided, or the generation of feasible basis paths is also
+        # requested, measure the values of the feasible basis paths.
+        if (args.measure_tests and (args.basis or not anyPathTypes)):
+            measureBasisPaths(analyzerLocation, simulator,
+                              analyzer=session.analyzer,
+                              numWorkers=args.jobs)
+            session.modified = True
+
+        # If the creation of a histogram is requested but no type has been
+        # provided, or the generation of feasible basis paths is also
+        # requested, create a histogram from the values of the feasible
+        # basis paths.
+        if (args.histogram and (args.basis or not anyPathTypes)):
+            createHistogramForBasisPaths(analyzerLocation, args.hist_bins,
+                                         args.hist_lower, args.hist_upper,
+                                         analyzer=session.analyzer)
+
+        # Generate other types of feasible paths, if requested.
+        if requestedPathTypes:
+            basisValuesLocation = (
+                os.path.abspath(args.values) if args.values
+                else os.path.join(analysisDir, "measured-basis")
+            )
+            numPaths = args.num_paths
+            interval = Interval(args.lower, args.upper)
+            useObExtraction = True if args.ob_extraction else False
+
+            # Read the arguments shared by all of the types of feasible paths.
+            doHistogram, doMeasure = args.histogram, args.measure_tests
+            histBins, histLower = args.hist_bins, args.hist_lower
+            histUpper = args.hist_upper
+            for pathType in requestedPathTypes:
+                paths = generatePaths(projectConfig, analyzerLocation,
+                                      basisValuesLocation, numPaths, pathType,
+                                      interval, useObExtraction,
+                                      analyzer=session.analyzer)
+                session.modified = True
+
+                # Create a histogram of the predicted values of
+                # the feasible paths generated, if requested. The values
+                # are extracted once, and shared by both histograms.
+                if doHistogram:
+                    pathArray = PathArray(paths)
+                    createHistogramForPaths(projectConfig, paths, pathType,
+                                            histBins, histLower, histUpper,
+                                            pathValues=pathArray.predicted)
+
+                # Measure the feasible paths generated, if requested.
+                if doMeasure:
+                    measurePaths(projectConfig, simulator, paths, pathType,
+                                 numWorkers=args.jobs)
+
+                # Create a histogram of the measured values of
+                # the feasible paths generated, if requested.
+                if doMeasure and doHistogram:
+                    pathArray.updateMeasured()
+                    createHistogramForPaths(projectConfig, paths, pathType,
+                                            histBins, histLower, histUpper,
+                                            measured=True,
+                                            pathValues=pathArray.measured)
 
 
 if __name__ == "__main__":
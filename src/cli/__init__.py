@@ -14,19 +14,68 @@ for details on the GameTime license and authors.
 import os
 import subprocess
 import sys
-import webbrowser
+import threading
 
 from gametime.defaults import config, logger, sourceDir
+from gametime.gametimeError import GameTimeError
 from gametime.updateChecker import isUpdateAvailable
 
 
-def startCli():
-    """Prepares and starts the command-line interface to GameTime."""
-    logger.info("Welcome to GameTime!")
-    logger.info("")
+#: Name of the environment variable that, if set to a non-empty value,
+#: disables the check for updates when the command-line interface starts.
+_noUpdateCheckEnvVar = "GAMETIME_NO_UPDATE_CHECK"
+
+
+def _checkForUpdates(results):
+    """Checks if an update to the current version of GameTime is available,
+    and appends the result of the check to the list provided. This function
+    is the target of the thread that checks for updates in the background.
+
+    Arguments:
+        results:
+            List to append the result of the check to, which is a tuple
+            as described in the documentation of the function
+            :func:`~gametime.updateChecker.isUpdateAvailable`.
+    """
+    results.append(isUpdateAvailable())
+
+def _openUrl(url):
+    """Opens the URL provided in a web browser, without waiting for
+    the web browser to start.
+
+    Arguments:
+        url:
+            URL to open.
+    """
+    if os.name == "nt":
+        # Hand the URL to the shell, which returns as soon as it has
+        # asked the default web browser to open the URL. This also
+        # avoids importing the :mod:`webbrowser` module, which searches
+        # the directories in PATH for known web browsers when imported.
+        try:
+            os.startfile(url)
+        except EnvironmentError as e:
+            raise GameTimeError(str(e))
+    else:
+        import webbrowser
+        try:
+            webbrowser.open(url)
+        except webbrowser.Error as e:
+            raise GameTimeError(str(e))
 
-    logger.info("Checking for any available updates...")
-    updateAvailable, latestVersionInfo = isUpdateAvailable()
+def _reportUpdates(updateAvailable, latestVersionInfo):
+    """Informs the user about an available update to GameTime, if any,
+    and offers to open the webpage from which the update can be obtained.
+
+    Arguments:
+        updateAvailable:
+            `True` if, and only if, an update to the current version
+            of GameTime is available.
+        latestVersionInfo:
+            Dictionary that contains information about the latest version
+            of GameTime that is available, as described in the documentation
+            of the function :func:`~gametime.updateChecker.isUpdateAvailable`.
+    """
     if updateAvailable:
         version = latestVersionInfo["version"]
         infoUrl = latestVersionInfo["info_url"]
@@ -41,9 +90,9 @@ def startCli():
         if choice in ["y", "yes"]:
             logger.info("Exiting GameTime...")
             try:
-                webbrowser.open(infoUrl)
+                _openUrl(infoUrl)
                 sys.exit(0)
-            except webbrowser.Error as e:
+            except GameTimeError as e:
                 logger.warning("Unable to open a web browser to display "
                                "information about the updated version: %s " % e)
                 logger.warning("Please visit %s to download and install "
@@ -60,8 +109,41 @@ def startCli():
         logger.warning("No updates to GameTime are available.")
     logger.info("")
 
+def startCli():
+    """Prepares and starts the command-line interface to GameTime."""
+    logger.info("Welcome to GameTime!")
+    logger.info("")
+
+    # Check for any available updates in the background, so that
+    # the command-line interface does not wait on the network to start.
+    # The check is skipped if it has been disabled, or if there is
+    # no user to answer the prompt that offers to install an update.
+    updateCheckThread = None
+    updateCheckResults = []
+    if not os.environ.get(_noUpdateCheckEnvVar) and sys.stdin.isatty():
+        updateCheckThread = threading.Thread(target=_checkForUpdates,
+                                             args=(updateCheckResults,))
+        updateCheckThread.daemon = True
+        updateCheckThread.start()
+
     # Construct the location of the directory that contains
     # the batch file that initializes the GameTime command-line interface.
     cliInitBatchFile = os.path.join(sourceDir,
                                     os.path.join("bin", "gametime-cli.bat"))
-    subprocess.call([cliInitBatchFile], shell=True)
+    # Run the batch file through the command interpreter directly,
+    # rather than through an additional shell. The batch file can
+    # only be run on Windows.
+    if os.name == "nt":
+        subprocess.call(["cmd", "/c", cliInitBatchFile])
+    else:
+        logger.error("Unable to start the GameTime command-line interface: "
+                     "the batch file at %s can only be run on Windows." %
+                     cliInitBatchFile)
+
+    # Report the result of the check for updates once the command-line
+    # interface exits, but only if the check has already completed.
+    if updateCheckThread is not None:
+        updateCheckThread.join(0)
+    if updateCheckResults:
+        logger.info("")
+        _reportUpdates(*updateCheckResults[0])
@@ -31,10 +31,9 @@ def createDir(location):
             Location of the directory to be created.
     """
     try:
-        if not os.path.isdir(location):
-            os.makedirs(location)
+        os.makedirs(location)
     except EnvironmentError as e:
-        if e.errno != errno.EEXIST:
+        if e.errno != errno.EEXIST or not os.path.isdir(location):
             raise GameTimeError("Cannot create directory located at %s: %s" %
                                 (location, e))
 
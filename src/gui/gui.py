@@ -15,8 +15,13 @@ import os
 import subprocess
 import sys
 import threading
+import traceback
 import webbrowser
 
+from collections import deque
+from functools import partial
+from itertools import imap, islice
+
 from PySide import QtCore
 from PySide import QtGui
 from PySide.QtCore import Qt
@@ -42,11 +47,109 @@ from gametime.gui.guiHelper import Saver
 from gametime.gui.guiHelper import TextEditObject
 from gametime.gui.guiHelper import Window
 from gametime.gui.guiHelper import XmlFileDialog
+from gametime.defaults import logger
+from gametime.fileHelper import removeFile
 from gametime.projectConfiguration import ProjectConfiguration
 from gametime.projectConfiguration import readProjectConfigFile
 from gametime.updateChecker import isUpdateAvailable
 
 
+#: Maximum number of lines that the console keeps. The oldest lines
+#: are discarded once this number is exceeded.
+CONSOLE_MAX_LINES = 5000
+
+#: Time, in milliseconds, for which messages are buffered before
+#: they are printed to the console.
+CONSOLE_FLUSH_INTERVAL = 30
+
+#: Time, in milliseconds, for which an analysis that is being cancelled
+#: is given to stop on its own before it is terminated.
+CANCEL_TIMEOUT = 500
+
+#: Number of path items that the analysis thread creates before
+#: it sends them to the GUI to be displayed together.
+PATH_ITEM_BATCH_SIZE = 32
+
+#: Items created for the paths that each analysis generates.
+#: Key: {int} Command of the analysis, as used by GenericAnalyzer.
+#: Value: {tuple} Name of the FileItem attribute that stores the items,
+#: and the prefix of the display names of the items.
+PATH_ITEM_SPECS = {
+    0: ("basisPaths", "+ Basis Path "),
+    1: ("bestPaths", "+ Best Path "),
+    2: ("worstPaths", "+ Worst Path "),
+    3: ("randomPaths", "+ Random Path "),
+    4: ("allPaths", "+ Path "),
+    5: ("allPaths", "+ Path ")
+}
+
+#: Messages printed to the console when an analysis starts.
+#: Key: {int} Command of the analysis, as used by GenericAnalyzer.
+#: Value: {string} Message, which may refer to the number of paths
+#: requested as `numPaths`, and to a plural suffix as `s`.
+ANALYSIS_START_MESSAGES = {
+    0: "Generating basis paths...",
+    1: "Generating %(numPaths)d best-case feasible path%(s)s...",
+    2: "Generating %(numPaths)d worst-case feasible path%(s)s...",
+    3: "Generating %(numPaths)d random feasible path%(s)s...",
+    4: "Generating all feasible paths in decreasing order of value...",
+    5: "Generating all feasible paths in increasing order of value..."
+}
+
+#: Messages printed to the console when an analysis is done.
+#: Key: {int} Command of the analysis, as used by GenericAnalyzer.
+#: Value: {string} Message, which may refer to the number of paths
+#: generated as `numPaths`, and to the suffix that makes the message
+#: plural as `s`.
+ANALYSIS_DONE_MESSAGES = {
+    0: "Basis paths have been generated.",
+    1: "%(numPaths)d best-case feasible path%(s)s been generated.",
+    2: "%(numPaths)d worst-case feasible path%(s)s been generated.",
+    3: "%(numPaths)d random feasible path%(s)s been generated.",
+    4: ("All feasible paths have been generated in "
+        "decreasing order of value."),
+    5: ("All feasible paths have been generated in "
+        "increasing order of value.")
+}
+
+#: Header of the stack traces shown for unhandled exceptions.
+TRACEBACK_HEADER = "Traceback (most recent call last):\n"
+
+
+#: Formats a single (variable, value) pair of a path assignment.
+_formatAssignment = "%s=%s".__mod__
+
+
+def _formatPath(path):
+    """
+    Arguments:
+        path:
+            Path object to format.
+
+    Returns:
+        Line that contains the assignments to variables that would drive
+        an execution along the path provided, followed by the predicted
+        value of the path, all separated by commas.
+    """
+    assignments = ",".join(imap(_formatAssignment,
+                                path.assignments.iteritems()))
+    if assignments:
+        return "%s,%s\n" % (assignments, path.predictedValue)
+    return "%s\n" % path.predictedValue
+
+
+def _removeFiles(locations):
+    """Removes the files at the locations provided, ignoring any
+    that are no longer present.
+
+    Arguments:
+        locations:
+            Locations of the files to remove.
+    """
+    for location in locations:
+        removeFile(location)
+
+
 class GameTimeGui(QtGui.QMainWindow):
     """
     The GUI main window. Inherits QtGui.QMainWindow. Maintains any actions
@@ -67,8 +170,6 @@ class GameTimeGui(QtGui.QMainWindow):
         """
         super(GameTimeGui, self).__init__()
         self.setWindowTitle("GameTime")
-        self.showFullScreen()
-        self.showMaximized()
 
         self.tempFiles = set([])
 
@@ -86,10 +187,21 @@ class GameTimeGui(QtGui.QMainWindow):
         #: Console dock widget.
         self.consoleWidget = None
 
+        #: Messages that are waiting to be printed to the console. Messages
+        #: are printed in batches, so that a burst of messages from
+        #: an analysis causes only one update of the console.
+        self._consoleBuffer = []
+
+        #: Timer that prints the messages waiting in the buffer
+        #: to the console when it fires.
+        self._consoleTimer = None
+
         #: Queue of functions to analyze. This allows slots to run
         #: prerequisite slots while still allowing the user to have
-        #: control over the GUI.
-        self.funcQueue = []
+        #: control over the GUI. A slot that is missing a prerequisite
+        #: appends itself before running the prerequisite slot, so the
+        #: most recently appended function is the next one to run.
+        self.funcQueue = deque()
 
         #: Cache of all currently open FileItem objects. These will all be
         #: displayed in the leftmost display.
@@ -97,6 +209,16 @@ class GameTimeGui(QtGui.QMainWindow):
         #: Value: {FileItem} FileItem object that corresponds to a unique file.
         self.openItems = {}
 
+        #: Threads that are reading files from disk.
+        #: Key: {string} Name of a unique file.
+        #: Value: {FileReaderThread} Thread that is reading the file.
+        self.fileReaderThreads = {}
+
+        #: Dialog used to choose the files that paths and values are saved
+        #: to. It is created the first time that it is needed and then
+        #: reused, so that its widgets are only built once.
+        self.saveFileDialog = None
+
         #: List of actions that should be disabled while analysis is running.
         self.analysisActions = []
         #: List of actions that can be performed if overcomplete basis was
@@ -116,6 +238,14 @@ class GameTimeGui(QtGui.QMainWindow):
         self.setupConsole()
         self.setupMenubar()
 
+        #: Actions that are enabled once analysis finishes, depending
+        #: on whether an overcomplete basis was generated.
+        overcompleteSupportedActions = \
+            frozenset(self.overcompleteSupportedActions)
+        self.overcompleteActionsToEnable = \
+            [action for action in self.analysisActions
+             if action in overcompleteSupportedActions]
+
         #: Show status bar. In this case, the status bar serves more as an
         #: informational bar about certain actions, such as menubar action
         #: descriptions.
@@ -132,10 +262,19 @@ class GameTimeGui(QtGui.QMainWindow):
         threadSignals.showException.connect(self.showException)
         self.showExceptionSignal = threadSignals.showException
 
-        self._checkForAvailableUpdates()
+        # Check for any available updates in a separate thread, so that
+        # the main window does not wait on the network to be shown.
+        self.updateCheckThread = UpdateCheckThread()
+        self.updateCheckThread.signals.doneChecking.connect(
+            self._reportAvailableUpdates
+        )
+        self.updateCheckThread.start()
+
+        # Show the window only once all of its widgets have been created,
+        # so that its layout is computed once.
+        self.showMaximized()
 
     def handleException(self, eType, eInstance, tb):
-        import traceback
         className = "%s: " % eType.__name__
         message = eInstance.message
         stackTrace = "".join(traceback.format_tb(tb))
@@ -148,8 +287,7 @@ class GameTimeGui(QtGui.QMainWindow):
 
     def showException(self, message, detailedTrace):
         ExceptionMessageBox(message,
-                            ("Traceback (most recent call last):\n%s" %
-                             detailedTrace)).exec_()
+                            TRACEBACK_HEADER + detailedTrace).exec_()
 
     def setupCenterLayout(self):
         """
@@ -203,10 +341,19 @@ class GameTimeGui(QtGui.QMainWindow):
         file analysis statuses, and so on. Creates self.consoleWidget.
         """
         self.consoleWidget = QtGui.QDockWidget("Console")
-        console = QtGui.QTextEdit()
+        # The console only ever has plain text appended to it, so use
+        # a widget that does not maintain a rich-text document, and
+        # limit the number of lines that it keeps.
+        console = QtGui.QPlainTextEdit()
         console.setReadOnly(True)
+        console.setMaximumBlockCount(CONSOLE_MAX_LINES)
         self.consoleWidget.setWidget(console)
 
+        self._consoleTimer = QtCore.QTimer(self)
+        self._consoleTimer.setSingleShot(True)
+        self._consoleTimer.setInterval(CONSOLE_FLUSH_INTERVAL)
+        self._consoleTimer.timeout.connect(self._flushConsole)
+
         self.addDockWidget(Qt.DockWidgetArea(Qt.BottomDockWidgetArea),
                            self.consoleWidget)
 
@@ -419,10 +566,9 @@ class GameTimeGui(QtGui.QMainWindow):
         viewMenu.addAction(zoomIn)
         viewMenu.addAction(zoomOut)
 
-    def _checkForAvailableUpdates(self):
+    def _reportAvailableUpdates(self, updateAvailable, latestVersionInfo):
         from gametime.defaults import config
 
-        updateAvailable, latestVersionInfo = isUpdateAvailable()
         if updateAvailable:
             version = latestVersionInfo["version"]
             infoUrl = latestVersionInfo["info_url"]
@@ -503,33 +649,55 @@ class GameTimeGui(QtGui.QMainWindow):
         self.changeFontSize(-2)
 
     def changeFontSize(self, amount):
+        # Only the widgets that display text are changed: Changing the font
+        # of the application would repolish every widget in the application.
         widgets = [
-            QtGui.QApplication,
             self.rightTextEdit,
             self.leftTextEdit,
             self.consoleWidget.widget(),
             self.fileSelectWidget.widget()
         ]
-        for widget in widgets:
-            currentFont = widget.font()
-            currentSize = currentFont.pointSize()
-            if currentSize + amount > 0:
-                currentFont.setPointSize(currentSize + amount)
-            widget.setFont(currentFont)
+        # Repaint the window once, after the fonts of all of the widgets
+        # have been changed.
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in widgets:
+                currentFont = widget.font()
+                currentSize = currentFont.pointSize()
+                if currentSize + amount > 0:
+                    currentFont.setPointSize(currentSize + amount)
+                widget.setFont(currentFont)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def printToConsole(self, message):
-        """Prints the provided message to the console and scrolls the viewport
-        if the viewport was not already at the bottom of the console.
+        """Prints the provided message to the console. The message is
+        buffered, and is printed along with any other messages provided
+        before the console is next updated.
 
         Arguments:
             message:
                 Message to print.
         """
+        self._consoleBuffer.append(str(message))
+        if not self._consoleTimer.isActive():
+            self._consoleTimer.start()
+
+    def _flushConsole(self):
+        """Prints the messages waiting in the buffer to the console and
+        scrolls the viewport if the viewport was not already at the bottom
+        of the console.
+        """
+        if not self._consoleBuffer:
+            return
         console = self.consoleWidget.widget()
-        console.append(str(message))
-
         vertBar = console.verticalScrollBar()
-        if vertBar.value() == vertBar.maximum():
+        atBottom = vertBar.value() == vertBar.maximum()
+
+        console.appendPlainText("\n".join(self._consoleBuffer))
+        self._consoleBuffer = []
+
+        if atBottom:
             vertBar.setValue(vertBar.maximum())
 
     def reset(self):
@@ -544,10 +712,7 @@ class GameTimeGui(QtGui.QMainWindow):
     def slotResetAction(self):
         fileSelect = self.fileSelectWidget.widget()
         currentFileItem = fileSelect.activeLeft.getAnalyzeItem()
-        for _ in range(len(currentFileItem.children)):
-            child = currentFileItem.children[0]
-            currentFileItem.removeChild(child)
-            fileSelect.removeItem(child)
+        currentFileItem.removeChildren(currentFileItem.children)
 
     def slotOpenProjectDialog(self):
         """Creates a QFileDialog and obtains a file name, which it
@@ -599,34 +764,39 @@ class GameTimeGui(QtGui.QMainWindow):
         self._loadFromProjectConfig(projectConfig)
 
     def _loadFromProjectConfig(self, projectConfig):
-        fileItemToAdd = None
-        locationOrigFile = projectConfig.locationOrigFile
         displayName = projectConfig.nameOrigFile
 
         # If fileName is already in fileSelect,
         # bypass loading from disk.
         if displayName in self.openItems:
             fileItemToAdd = self.openItems[displayName]
-        else:
-            # If the fileName has not been encountered yet, create a new
-            # FileItem object and load the proper data from disk.
-            try:
-                origFileHandler = open(locationOrigFile, "r")
-            except EnvironmentError as err:
-                errno, strerror = err
-                self.printToConsole(
-                    "I/O error({0}): {1}.".format(errno, strerror)
-                )
-            except Exception as errno:
-                self.printToConsole("Error({0})".format(errno))
-            finally:
-                with origFileHandler:
-                    fileText = origFileHandler.read()
-                    fileItemToAdd = FileItem(displayName,
-                                             locationOrigFile,
-                                             fileText,
-                                             self)
-                    fileItemToAdd.addToMainWindow()
+            fileItemToAdd.setProjectConfig(projectConfig)
+            self.addToWindow(fileItemToAdd, Window.LEFT)
+        elif displayName not in self.fileReaderThreads:
+            # If the fileName has not been encountered yet, read the file
+            # from disk in a separate thread, so that the GUI remains
+            # responsive while a large file is read. A new FileItem object
+            # is created once the file has been read.
+            fileReaderThread = FileReaderThread(projectConfig)
+            fileReaderSignals = fileReaderThread.signals
+            fileReaderSignals.doneReading.connect(self._finishLoading)
+            fileReaderSignals.printToConsole.connect(self.printToConsole)
+            self.fileReaderThreads[displayName] = fileReaderThread
+            fileReaderThread.start()
+
+    def _finishLoading(self, projectConfig, fileText):
+        displayName = projectConfig.nameOrigFile
+        fileReaderThread = self.fileReaderThreads.pop(displayName)
+        # The thread emits its result just before it finishes.
+        fileReaderThread.wait()
+        if fileText is None:
+            return
+
+        fileItemToAdd = FileItem(displayName,
+                                 projectConfig.locationOrigFile,
+                                 fileText,
+                                 self)
+        fileItemToAdd.addToMainWindow()
         fileItemToAdd.setProjectConfig(projectConfig)
         self.addToWindow(fileItemToAdd, Window.LEFT)
 
@@ -694,12 +864,13 @@ class GameTimeGui(QtGui.QMainWindow):
         if possible. This allows the user to interact with the GUI
         while the GameTime analysis is running.
         """
-        if self.leftTextEdit.fileItemObject is None:
+        fileItem = self.leftTextEdit.fileItemObject
+        if fileItem is None:
             self.printToConsole("There is currently no file for which "
                                 "GameTime can generate basis paths.")
             return
 
-        itemToAnalyze = self.leftTextEdit.fileItemObject.getAnalyzeItem()
+        itemToAnalyze = fileItem.getAnalyzeItem()
         if len(itemToAnalyze.children) > 0:
             val = ConfirmationDialog("This will delete all paths currently \n"
                                      "generated for this file. Are you sure \n"
@@ -719,10 +890,7 @@ class GameTimeGui(QtGui.QMainWindow):
                 basisAnalyzer.generateOvercompleteBasis
         else: return
         
-        for _ in range(len(itemToAnalyze.children)):
-            child = itemToAnalyze.children[0]
-            itemToAnalyze.removeChild(child)
-            itemToAnalyze.fileList.removeItem(child)
+        itemToAnalyze.removeChildren(itemToAnalyze.children)
 
         self.disableAnalysis()
         self.analysisThread.setAnalyzer(basisAnalyzer)
@@ -742,12 +910,13 @@ class GameTimeGui(QtGui.QMainWindow):
         analysis is running. The only files that can have random paths are
         valid .c files that have been opened by the user.
         """
-        if self.leftTextEdit.fileItemObject is None:
+        fileItem = self.leftTextEdit.fileItemObject
+        if fileItem is None:
             self.printToConsole("There is currently no file for which GameTime "
                                 "can generate random feasible paths.")
             return
 
-        itemToAnalyze = self.leftTextEdit.fileItemObject.getAnalyzeItem()
+        itemToAnalyze = fileItem.getAnalyzeItem()
         if itemToAnalyze.numBasisPaths == 0:
             self.printToConsole("Basis paths have not been generated for "
                                 "this file. Generating the paths now...")
@@ -757,10 +926,7 @@ class GameTimeGui(QtGui.QMainWindow):
 
         randomAnalyzer = GenericAnalyzer(3, self)
         if NumPathsDialog(randomAnalyzer, "Random").exec_() == 1:
-            for _ in range(len(itemToAnalyze.randomPaths)):
-                path = itemToAnalyze.randomPaths[0]
-                itemToAnalyze.removeChild(path)
-                itemToAnalyze.fileList.removeItem(path)
+            itemToAnalyze.removeChildren(itemToAnalyze.randomPaths)
 
             self.disableAnalysis()
             self.analysisThread.setAnalyzer(randomAnalyzer)
@@ -774,13 +940,14 @@ class GameTimeGui(QtGui.QMainWindow):
         the GUI while analysis is running. The only files that can have paths
         are valid .c files that have been opened by the user.
         """
-        if self.leftTextEdit.fileItemObject is None:
+        fileItem = self.leftTextEdit.fileItemObject
+        if fileItem is None:
             self.printToConsole("There is currently no file for which GameTime "
                                 "can generate all feasible paths in order of "
                                 "increasing value.")
             return
 
-        itemToAnalyze = self.leftTextEdit.fileItemObject.getAnalyzeItem()
+        itemToAnalyze = fileItem.getAnalyzeItem()
         if itemToAnalyze.numBasisPaths == 0:
             self.printToConsole("Basis paths have not been generated for "
                                 "this file. Generating them now...")
@@ -791,10 +958,7 @@ class GameTimeGui(QtGui.QMainWindow):
         allPathAnalyzer = GenericAnalyzer(5, self)
         if AllPathsDialog(allPathAnalyzer,
             itemToAnalyze.projectConfig.OVER_COMPLETE_BASIS).exec_() == 1:
-            for _ in range(len(itemToAnalyze.allPaths)):
-                path = itemToAnalyze.allPaths[0]
-                itemToAnalyze.removeChild(path)
-                itemToAnalyze.fileList.removeItem(path)
+            itemToAnalyze.removeChildren(itemToAnalyze.allPaths)
 
             self.disableAnalysis()
             self.analysisThread.setAnalyzer(allPathAnalyzer)
@@ -808,27 +972,25 @@ class GameTimeGui(QtGui.QMainWindow):
         the GUI while analysis is running. The only files that can have paths
         are valid .c files that have been opened by the user.
         """
-        if self.leftTextEdit.fileItemObject is None:
+        fileItem = self.leftTextEdit.fileItemObject
+        if fileItem is None:
             self.printToConsole("There is currently no file for which GameTime "
                                 "can generate all feasible paths in order of "
                                 "decreasing value.")
             return
 
-        itemToAnalyze = self.leftTextEdit.fileItemObject.getAnalyzeItem()
+        itemToAnalyze = fileItem.getAnalyzeItem()
         if itemToAnalyze.numBasisPaths == 0:
             self.printToConsole("Basis paths have not been generated for "
                                 "this file. Generating them now...")
             self.slotFindBasisPaths()
-            self.funcQueue.append(self.slotAllPathsDe)
+            self.funcQueue.append(self.slotAllPathsDec)
             return
 
         allPathAnalyzer = GenericAnalyzer(4, self)
         if AllPathsDialog(allPathAnalyzer,
             itemToAnalyze.projectConfig.OVER_COMPLETE_BASIS).exec_() == 1:
-            for _ in range(len(itemToAnalyze.allPaths)):
-                path = itemToAnalyze.allPaths[0]
-                itemToAnalyze.removeChild(path)
-                itemToAnalyze.fileList.removeItem(path)
+            itemToAnalyze.removeChildren(itemToAnalyze.allPaths)
 
             self.disableAnalysis()
             self.analysisThread.setAnalyzer(allPathAnalyzer)
@@ -836,150 +998,119 @@ class GameTimeGui(QtGui.QMainWindow):
             self.analysisThread.setFunc(self.findPathsHelper, [allPathAnalyzer])
             self.analysisThread.start()
 
-    def slotWriteRandom(self):
-        """
-        Checks if the worst cases have already been generated for
-        the currently active file.
-        If they have been, then it just writes them to files.
-        If they have not been, then it prompts the user how many they
-        would like to generate and generates them before writing them
-        to files.
+    #: Information used to write each type of feasible paths to a file.
+    #: Key: {string} Type of feasible paths.
+    #: Value: {tuple} Name of the FileItem method that returns the paths
+    #: of this type, name of the slot that generates them, and
+    #: a description of the paths.
+    _writePathsSpecs = {
+        "random": ("getRandomPaths", "slotFindRandomPaths",
+                   "random feasible paths"),
+        "allInc": ("getAllPaths", "slotAllPathsInc",
+                   "feasible paths in increasing order of value"),
+        "allDec": ("getAllPaths", "slotAllPathsDec",
+                   "feasible paths in decreasing order of value"),
+        "best": ("getBestPaths", "slotShortestCases",
+                 "best-case feasible paths"),
+        "worst": ("getWorstPaths", "slotLongestCases",
+                  "worst-case feasible paths"),
+    }
+
+    def _writePaths(self, pathsType):
+        """Checks if feasible paths of the type provided have already been
+        generated for the currently active file. If they have been generated,
+        then it just writes them to a file chosen by the user. If they have
+        not been generated, then it generates them, and the basis paths
+        if necessary, before writing them to a file.
+
+        Arguments:
+            pathsType:
+                Type of feasible paths to write, which is a key of
+                the ``_writePathsSpecs`` dictionary.
         """
+        getterName, generateSlotName, pathsDesc = \
+            self._writePathsSpecs[pathsType]
+        # Write the paths again once any prerequisite analysis finishes.
+        writeSlot = partial(self._writePaths, pathsType)
+
         currentFile = self.fileSelectWidget.widget().activeLeft.getAnalyzeItem()
         if not currentFile:
-            self.printToConsole("Not a valid file to analyze")
+            self.printToConsole("Not a valid file to analyze.")
             return
-        if currentFile.getBasisPaths() == []:
+        if not currentFile.getBasisPaths():
             self.printToConsole("No basis paths have been generated "
                                 "yet. Generating them now...")
             self.slotFindBasisPaths()
-            self.funcQueue.append(self.slotWriteRandom)
+            self.funcQueue.append(writeSlot)
             return
-        if currentFile.getRandomPaths() == []:
-            self.printToConsole("No random feasible paths have been generated "
-                                "yet. Generating them now...")
-            self.slotFindRandomPaths()
-            self.funcQueue.append(self.slotWriteRandom)
+        pathItems = getattr(currentFile, getterName)()
+        if not pathItems:
+            self.printToConsole("No %s have been generated yet. "
+                                "Generating them now..." % pathsDesc)
+            getattr(self, generateSlotName)()
+            self.funcQueue.append(writeSlot)
             return
 
-        fileDialog = QtGui.QFileDialog()
-        fileNameChoice = fileDialog.getSaveFileName(
-            self,
-            "Save File",
-            "."
-        )
-
-        pathText = ""
-        for pathItem in currentFile.getRandomPaths():
-            path = pathItem.getHighlightPath()
-            for var, val in path.assignments.items():
-                pathText += "%s=%s," % (var, val)
-            pathText += "%s\n" % path.value
+        fileNameChoice = self._getSaveFileName()
         if not fileNameChoice:
             self.printToConsole("No file was selected to save values to.")
             return
 
-        fileWriter = open(fileNameChoice, "w")
-        fileWriter.write(pathText)
-        fileWriter.close()
-        self.printToConsole("Random paths saved to %s" % fileNameChoice)
+        self._writePathsToFile(pathItems, fileNameChoice)
+        self.printToConsole("The %s have been saved to %s." %
+                            (pathsDesc, fileNameChoice))
 
-    def slotWriteAllInc(self):
-        """
-        Checks if the worst cases have already been generated for
-        the currently active file.
-        If they have been, then it just writes them to files.
-        If they have not been, then it prompts the user how many they
-        would like to generate and generates them before writing them
-        to files.
+    def _getSaveFileName(self):
         """
-        currentFile = self.fileSelectWidget.widget().activeLeft.getAnalyzeItem()
-        if not currentFile:
-            self.printToConsole("Not a valid file to analyze.")
-            return
-        if currentFile.getBasisPaths() == []:
-            self.printToConsole("No basis paths have been generated "
-                                "yet. Generating them now...")
-            self.slotFindBasisPaths()
-            self.funcQueue.append(self.slotWriteAllInc)
-            return
-        if currentFile.getAllPaths() == []:
-            self.printToConsole("All feasible paths have not been generated "
-                                "yet. Generating them now...")
-            self.slotFindAllPathsInc()
-            self.funcQueue.append(self.slotWriteWriteAllInc)
-            return
-
-        fileDialog = QtGui.QFileDialog()
-        fileNameChoice = fileDialog.getSaveFileName(
-            self,
-            "Save File",
-            "."
-        )
+        Shows the dialog that is shared by the slots that save paths
+        and values to a file.
 
-        pathText = ""
-        for pathItem in currentFile.getAllPaths():
-            path = pathItem.getHighlightPath()
-            for var, val in path.assignments.items():
-                pathText += "%s=%s," % (var, val)
-            pathText += "%s\n" % path.value
-        if not fileNameChoice:
-            self.printToConsole("No file was selected to save values to.")
-            return
+        Returns:
+            Name of the file chosen, or None if no file was chosen.
+        """
+        if self.saveFileDialog is None:
+            self.saveFileDialog = QtGui.QFileDialog(self, "Save File", ".")
+            self.saveFileDialog.setAcceptMode(QtGui.QFileDialog.AcceptSave)
+        if not self.saveFileDialog.exec_():
+            return None
+        return self.saveFileDialog.selectedFiles()[0]
 
-        fileWriter = open(fileNameChoice, "w")
-        fileWriter.write(pathText)
-        fileWriter.close()
-        self.printToConsole("All paths saved to %s" %fileNameChoice)
+    def _writePathsToFile(self, pathItems, fileName):
+        """Writes the assignments and the value of each of the paths
+        provided to a file, one path per line.
 
-    def slotWriteAllDec(self):
-        """
-        Checks if the worst cases have already been generated for
-        the currently active file.
-        If they have been, then it just writes them to files.
-        If they have not been, then it prompts the user how many they
-        would like to generate and generates them before writing them
-        to files.
+        Arguments:
+            pathItems:
+                List of FileItem objects, each of which is associated
+                with a path to write.
+            fileName:
+                Name of the file to write to.
         """
-        currentFile = self.fileSelectWidget.widget().activeLeft.getAnalyzeItem()
-        if not currentFile:
-            self.printToConsole("Not a valid file to analyze.")
-            return
-        if currentFile.getBasisPaths() == []:
-            self.printToConsole("No basis paths have been generated "
-                                "yet. Generating them now...")
-            self.slotFindBasisPaths()
-            self.funcQueue.append(self.slotWriteAllDec)
-            return
-        if currentFile.getAllPaths() == []:
-            self.printToConsole("All feasible paths, in order of decreasing "
-                                "value, have not been generated yet. "
-                                "Generating them now...")
-            self.slotAllPathsDec()
-            self.funcQueue.append(self.slotWriteAllDec)
-            return
+        pathLines = [_formatPath(pathItem.getHighlightPath())
+                     for pathItem in pathItems]
+        with open(fileName, "w") as fileWriter:
+            fileWriter.write("".join(pathLines))
 
-        fileDialog = QtGui.QFileDialog()
-        fileNameChoice = fileDialog.getSaveFileName(
-            self,
-            "Save File",
-            "."
-        )
+    def slotWriteRandom(self):
+        """Writes the random feasible paths generated for
+        the currently active file to a file, generating them first
+        if necessary.
+        """
+        self._writePaths("random")
 
-        pathText = ""
-        for pathItem in currentFile.getAllPaths():
-            path = pathItem.getHighlightPath()
-            for var, val in path.assignments.items():
-                pathText += "%s=%s," % (var, val)
-            pathText += "%s\n" % path.value
-        if not fileNameChoice:
-            self.printToConsole("No file was selected to save values to.")
-            return
+    def slotWriteAllInc(self):
+        """Writes all of the feasible paths, in increasing order of value,
+        generated for the currently active file to a file, generating them
+        first if necessary.
+        """
+        self._writePaths("allInc")
 
-        fileWriter = open(fileNameChoice, "w")
-        fileWriter.write(pathText)
-        fileWriter.close()
-        self.printToConsole("All feasible paths saved to %s." % fileNameChoice)
+    def slotWriteAllDec(self):
+        """Writes all of the feasible paths, in decreasing order of value,
+        generated for the currently active file to a file, generating them
+        first if necessary.
+        """
+        self._writePaths("allDec")
 
     def findPathsHelper(self, analyzer):
         """Function, which is run in the new thread, that handles running
@@ -988,114 +1119,42 @@ class GameTimeGui(QtGui.QMainWindow):
         return analyzer.exec_()
 
     def slotCancelAction(self):
+        """Cancels the analysis that is currently running, if any.
+        The analysis is given up to `CANCEL_TIMEOUT` milliseconds to stop
+        on its own before it is terminated, during which the GUI thread
+        is blocked.
+        """
         if self.analysisThread.isRunning():
+            # Ask the thread to stop at its next check, and terminate it
+            # only if it does not stop in time, such as when it is waiting
+            # on the analyzer.
+            self.analysisThread.cancelRequested.set()
+            if not self.analysisThread.wait(CANCEL_TIMEOUT):
+                self.analysisThread.terminate()
+                self.analysisThread.wait()
+            # Reset the count of basis paths only after the thread has
+            # stopped, so that it cannot be incremented again.
             if self.analysisThread.analyzer.enumCommand == 0:
                 self.analysisThread.itemToAnalyze.numBasisPaths = 0
-            self.analysisThread.terminate()
             self.printToConsole("Current analysis has been cancelled.")
         else:
             self.printToConsole("There was no analysis to cancel.")
         self.enableAnalysis()
-        self.funcQueue = []
+        self.funcQueue.clear()
 
     def slotWriteBest(self):
-        """Checks if the best case feasible paths have already been
-        generated for the currently active file. If they have been generated,
-        then it just writes them to files. If they have not been
-        generated, then it prompts the user how many they would
-        like to generate and generates them before writing them to files.
+        """Writes the best-case feasible paths generated for
+        the currently active file to a file, generating them first
+        if necessary.
         """
-        currentFile = self.fileSelectWidget.widget().activeLeft.getAnalyzeItem()
-        if not currentFile:
-            self.printToConsole("Not a valid file to analyze.")
-            return
-        if currentFile.getBasisPaths() == []:
-            self.printToConsole("No basis paths have been generated "
-                                "yet. Generating them now...")
-            self.slotFindBasisPaths()
-            self.funcQueue.append(self.slotWriteBest)
-            return
-        if currentFile.getBestPaths() == []:
-            self.printToConsole("No best-case feasible paths have been "
-                                "generated yet. Generating them now...")
-            self.slotShortestCases()
-            self.funcQueue.append(self.slotWriteBest)
-            return
-        # bestPaths = [path.getHighlightPath() for path
-        #              in currentFile.getBestPaths()]
-
-        # Open the file dialog to choose a new file to save to
-        #Write the paths out, csv atm
-        #Write the assignments then value to file
-        fileDialog = QtGui.QFileDialog()
-        fileNameChoice = fileDialog.getSaveFileName(
-            self,
-            "Save File",
-            "."
-        )
-
-        pathText = ""
-        for pathItem in currentFile.getBestPaths():
-            path = pathItem.getHighlightPath()
-            for var, val in path.assignments.items():
-                pathText += "%s=%s," % (var, val)
-            pathText += "%s\n" % path.value
-        if not fileNameChoice:
-            self.printToConsole("No file was selected to save values to.")
-            return
-
-        fileWriter = open(fileNameChoice, "w")
-        fileWriter.write(pathText)
-        fileWriter.close()
-        self.printToConsole("Best paths saved to %s" % fileNameChoice)
+        self._writePaths("best")
 
     def slotWriteWorst(self):
+        """Writes the worst-case feasible paths generated for
+        the currently active file to a file, generating them first
+        if necessary.
         """
-        Checks if the worst cases have already been generated for
-        the currently active file.
-        If they have been, then it just writes them to files.
-        If they have not been, then it prompts the user how many they
-        would like to generate and generates them before writing them
-        to files.
-        """
-        currentFile = self.fileSelectWidget.widget().activeLeft.getAnalyzeItem()
-        if not currentFile:
-            self.printToConsole("Not a valid file to analyze.")
-            return
-        if currentFile.getBasisPaths() == []:
-            self.printToConsole("No basis paths have been generated "
-                                "yet. Generating them now...")
-            self.slotFindBasisPaths()
-            self.funcQueue.append(self.slotWriteWorst)
-            return
-        if currentFile.getWorstPaths() == []:
-            self.printToConsole("No worst-case feasible paths have been "
-                                "generated yet. Generating them now...")
-            self.slotLongestCases()
-            self.funcQueue.append(self.slotWriteWorst)
-            return
-
-        fileDialog = QtGui.QFileDialog()
-        fileNameChoice = fileDialog.getSaveFileName(
-            self,
-            "Save File",
-            "."
-        )
-
-        pathText = ""
-        for pathItem in currentFile.getWorstPaths():
-            path = pathItem.getHighlightPath()
-            for var, val in path.assignments.items():
-                pathText += "%s=%s," % (var, val)
-            pathText += "%s\n" % path.value
-        if not fileNameChoice:
-            self.printToConsole("No file was selected to save values to.")
-            return
-
-        fileWriter = open(fileNameChoice, "w")
-        fileWriter.write(pathText)
-        fileWriter.close()
-        self.printToConsole("Worst paths saved to %s" %fileNameChoice)
+        self._writePaths("worst")
 
     def slotBasisValuesDialog(self):
         """
@@ -1120,8 +1179,7 @@ class GameTimeGui(QtGui.QMainWindow):
             self.printToConsole("No new basis values entered.")
 
     def slotSaveBasisValues(self):
-        fileDialog = QtGui.QFileDialog()
-        fileName, _ = fileDialog.getSaveFileName(self, "Save File", ".")
+        fileName = self._getSaveFileName()
 
         # Check that values have been entered
         # if not valuesEntered:
@@ -1168,12 +1226,13 @@ class GameTimeGui(QtGui.QMainWindow):
         is running. The only files that can have best paths are valid .c files
         that have been opened by the user.
         """
-        if self.leftTextEdit.fileItemObject is None:
+        fileItem = self.leftTextEdit.fileItemObject
+        if fileItem is None:
             self.printToConsole("There is currently no file for which GameTime "
                                 "can generate best-case feasible paths.")
             return
 
-        itemToAnalyze = self.leftTextEdit.fileItemObject.getAnalyzeItem()
+        itemToAnalyze = fileItem.getAnalyzeItem()
         if itemToAnalyze.numBasisPaths == 0:
             self.printToConsole("Basis paths have not been generated "
                                 "for this file. Generating them now...")
@@ -1185,10 +1244,7 @@ class GameTimeGui(QtGui.QMainWindow):
         
         if NumPathsDialog(shortAnalyzer, "Best",
             itemToAnalyze.projectConfig.OVER_COMPLETE_BASIS).exec_() == 1:
-            for _ in range(len(itemToAnalyze.bestPaths)):
-                path = itemToAnalyze.bestPaths[0]
-                itemToAnalyze.removeChild(path)
-                itemToAnalyze.fileList.removeItem(path)
+            itemToAnalyze.removeChildren(itemToAnalyze.bestPaths)
 
             self.disableAnalysis()
             self.analysisThread.setAnalyzer(shortAnalyzer)
@@ -1212,12 +1268,13 @@ class GameTimeGui(QtGui.QMainWindow):
         is running. The only files that can have worst paths are valid .c files
         that have been opened by the user.
         """
-        if self.leftTextEdit.fileItemObject is None:
+        fileItem = self.leftTextEdit.fileItemObject
+        if fileItem is None:
             self.printToConsole("There is currently no file for which GameTime "
                                 "can generate worst-case feasible paths.")
             return
 
-        itemToAnalyze = self.leftTextEdit.fileItemObject.getAnalyzeItem()
+        itemToAnalyze = fileItem.getAnalyzeItem()
         if itemToAnalyze.numBasisPaths == 0:
             self.printToConsole("Basis paths have not been generated for "
                                 "this file. Generating them now...")
@@ -1228,10 +1285,7 @@ class GameTimeGui(QtGui.QMainWindow):
         longAnalyzer = GenericAnalyzer(2, self)
         if NumPathsDialog(longAnalyzer, "Worst",
             itemToAnalyze.projectConfig.OVER_COMPLETE_BASIS).exec_() == 1:
-            for _ in range(len(itemToAnalyze.worstPaths)):
-                path = itemToAnalyze.worstPaths[0]
-                itemToAnalyze.removeChild(path)
-                itemToAnalyze.fileList.removeItem(path)
+            itemToAnalyze.removeChildren(itemToAnalyze.worstPaths)
             self.disableAnalysis()
             self.analysisThread.setAnalyzer(longAnalyzer)
             self.analysisThread.setItem(itemToAnalyze)
@@ -1268,18 +1322,38 @@ class GameTimeGui(QtGui.QMainWindow):
         return highlighter.exec_()
 
     def closeEvent(self, e):
-        while self.tempFiles != set([]):
-            temp = self.tempFiles.pop()
-            os.remove(temp)
+        # Remove the temporary files in a separate thread, so that
+        # the window closes without waiting for them to be removed.
+        # The thread is not a daemon thread, so the application
+        # does not exit before the files have been removed.
+        tempFiles, self.tempFiles = self.tempFiles, set()
+        if tempFiles:
+            threading.Thread(target=_removeFiles, args=(tempFiles,)).start()
         super(GameTimeGui, self).closeEvent(e)
 
     def slotUpdateGui(self, path):
         path.addToMainWindow()
         self.addToWindow(path, Window.RIGHT)
 
+    def slotUpdateGuiBatch(self, paths):
+        """Displays the path items provided, repainting the file select
+        list only once all of them have been added.
+
+        Arguments:
+            paths:
+                List of path items to display.
+        """
+        fileList = self.fileSelectWidget.widget()
+        fileList.setUpdatesEnabled(False)
+        try:
+            for path in paths:
+                self.slotUpdateGui(path)
+        finally:
+            fileList.setUpdatesEnabled(True)
+
     def slotFinishAnalysis(self):
         self.enableAnalysis()
-        if len(self.funcQueue) > 0:
+        if self.funcQueue:
             nextFunc = self.funcQueue.pop()
             nextFunc()
 
@@ -1288,16 +1362,18 @@ class GameTimeGui(QtGui.QMainWindow):
 
     def disableAnalysis(self):
         self.cancelAction.setDisabled(False)
-        print "Disable analysis"
+        logger.debug("Disable analysis")
         for action in self.analysisActions:
             action.setDisabled(True)
 
     def enableAnalysis(self):
         self.cancelAction.setDisabled(True)
-        print "enableAnalysis"
-        for action in self.analysisActions:
-            if self.generatedOvercompleteBasis and \
-                not (action in self.overcompleteSupportedActions): continue
+        logger.debug("Enable analysis")
+        if self.generatedOvercompleteBasis:
+            actionsToEnable = self.overcompleteActionsToEnable
+        else:
+            actionsToEnable = self.analysisActions
+        for action in actionsToEnable:
             action.setDisabled(False)
 
     def slotShowLoopDialog(self):
@@ -1308,13 +1384,13 @@ class GameTimeGui(QtGui.QMainWindow):
             loopDialog = LoopBoundsDialog(self)
             if loopDialog.exec_() == 0:
                 self.enableAnalysis()
-                self.funcQueue = []
+                self.funcQueue.clear()
                 self.printToConsole("Current analysis was cancelled.")
             else:
                 self.analysisThread.start()
         else:
             self.enableAnalysis()
-            self.funcQueue = []
+            self.funcQueue.clear()
             self.printToConsole("Current analysis was cancelled.")
 
     def showMessageDialog(self, message, basis=False, title="Message"):
@@ -1326,6 +1402,7 @@ class GameTimeGui(QtGui.QMainWindow):
 
 class WorkerThreadSignals(QtCore.QObject):
     updateGui = Signal(FileItem)
+    updateGuiBatch = Signal(list)
     doneAnalyzing = Signal()
     showLoopDialog = Signal()
     showMessage = Signal(str, bool)
@@ -1340,47 +1417,38 @@ class WorkerThread(QtCore.QThread):
         self.func = func
         self.args = args
         self.signals = WorkerThreadSignals()
-        self.signals.showMessage.connect(self.gui.showMessageDialog)
+        # Connect the signals that update the GUI once. The slots are
+        # queued, so that they run in the GUI thread.
+        self.signals.showMessage.connect(self.gui.showMessageDialog,
+                                         Qt.QueuedConnection)
+        self.signals.updateGui.connect(self.gui.slotUpdateGui,
+                                       Qt.QueuedConnection)
+        self.signals.updateGuiBatch.connect(self.gui.slotUpdateGuiBatch,
+                                            Qt.QueuedConnection)
+
+        #: Event that is set when the current analysis should be cancelled.
+        #: The thread checks this event once the analyzer returns, and
+        #: before it creates the item for each path generated.
+        self.cancelRequested = threading.Event()
+
+    def start(self):
+        self.cancelRequested.clear()
+        super(WorkerThread, self).start()
 
     def run(self):
-        if self.analyzer.enumCommand == 0:
-            self.signals.printToConsole.emit("Generating basis paths...")
-        elif self.analyzer.enumCommand == 1:
-            self.signals.printToConsole.emit(
-                "Generating %d best-case feasible path%s..." %
-                (
-                    self.analyzer.numPaths,
-                    "s" if self.analyzer.numPaths > 1 else ""
-                )
-            )
-        elif self.analyzer.enumCommand == 2:
-            self.signals.printToConsole.emit(
-                "Generating %d worst-case feasible path%s..." %
-                (
-                    self.analyzer.numPaths,
-                    "s" if self.analyzer.numPaths > 1 else ""
-                )
-            )
-        elif self.analyzer.enumCommand == 3:
-            self.signals.printToConsole.emit(
-                "Generating %d random feasible path%s..." %
-                (
-                    self.analyzer.numPaths,
-                    "s" if self.analyzer.numPaths > 1 else ""
-                )
-            )
-        elif self.analyzer.enumCommand == 4:
-            self.signals.printToConsole.emit(
-                "Generating all feasible paths in decreasing order of value..."
-            )
-        elif self.analyzer.enumCommand == 5:
+        enumCommand = self.analyzer.enumCommand
+        if enumCommand in ANALYSIS_START_MESSAGES:
+            numPaths = self.analyzer.numPaths
             self.signals.printToConsole.emit(
-                "Generating all feasible paths in increasing order of value..."
+                ANALYSIS_START_MESSAGES[enumCommand] %
+                {"numPaths": numPaths, "s": "s" if numPaths > 1 else ""}
             )
 
         paths = self.func(*self.args)
+        if self.cancelRequested.is_set():
+            return
         numPaths = len(paths)
-        if numPaths > 0 or self.analyzer.enumCommand == 0:
+        if numPaths > 0 or enumCommand == 0:
             if paths == []:
                 self.signals.printToConsole.emit(
                     "Loops were detected in the code."
@@ -1394,77 +1462,68 @@ class WorkerThread(QtCore.QThread):
                 if itemToAnalyze.preprocessedFileItem is None:
                     projectConfig = itemToAnalyze.projectConfig
                     preprocessedFile = projectConfig.locationTempFile
-                    fileText = ""
+                    # Read the whole file, and close it, before the item
+                    # that displays it is created.
                     with open(preprocessedFile) as preprocessedReader:
                         fileText = preprocessedReader.read()
 
-                        preprocessedFileItem = FileItem(
-                            " (Preprocessed)",
-                            preprocessedFile,
-                            fileText,
-                            self.analyzer.mainWindow,
-                            assign=True
-                        )
-                        preprocessedFileItem.originalName = \
-                        itemToAnalyze.origLocation
-                        preprocessedFileItem.setParent(self.itemToAnalyze)
-                        preprocessedFileItem.setAnalyze(False)
-                        itemToAnalyze.setPreprocessedFileItem(
-                            preprocessedFileItem
-                        )
-
-                        self.signals.updateGui.connect(self.gui.slotUpdateGui)
-                        self.signals.updateGui.emit(preprocessedFileItem)
+                    preprocessedFileItem = FileItem(
+                        " (Preprocessed)",
+                        preprocessedFile,
+                        fileText,
+                        self.analyzer.mainWindow,
+                        assign=True
+                    )
+                    preprocessedFileItem.originalName = \
+                    itemToAnalyze.origLocation
+                    preprocessedFileItem.setParent(self.itemToAnalyze)
+                    preprocessedFileItem.setAnalyze(False)
+                    itemToAnalyze.setPreprocessedFileItem(
+                        preprocessedFileItem
+                    )
+
+                    self.signals.updateGui.emit(preprocessedFileItem)
 
                 text = ""
                 numPaths = self.analyzer.numPaths
-                isBasis = False
-                if self.analyzer.enumCommand == 0:
-                    text = "Basis paths have been generated."
-                    isBasis = True
-                elif self.analyzer.enumCommand == 1:
-                    text = ("%d best-case feasible path%s been generated." %
-                            (numPaths, "s have" if numPaths > 1 else " has"))
-                elif self.analyzer.enumCommand == 2:
-                    text = ("%d worst-case feasible path%s been generated." %
-                            (numPaths, "s have" if numPaths > 1 else " has"))
-                elif self.analyzer.enumCommand == 3:
-                    text = ("%d random feasible path%s been generated." %
-                            (numPaths, "s have" if numPaths > 1 else " has"))
-                elif self.analyzer.enumCommand == 4:
-                    text = ("All feasible paths have been generated in "
-                            "decreasing order of value.")
-                elif self.analyzer.enumCommand == 5:
-                    text = ("All feasible paths have been generated in "
-                            "increasing order of value.")
+                isBasis = enumCommand == 0
+                if enumCommand in ANALYSIS_DONE_MESSAGES:
+                    text = ANALYSIS_DONE_MESSAGES[enumCommand] % {
+                        "numPaths": numPaths,
+                        "s": "s have" if numPaths > 1 else " has"
+                    }
                 self.signals.printToConsole.emit(text)
                 self.signals.showMessage.emit(text, isBasis)
 
         caseNumber = 1
         toWrite = []
-        if self.analyzer.enumCommand == 0:
-            self.itemToAnalyze.numBasisPaths = 0
-            pathList = self.itemToAnalyze.basisPaths
-            label = "+ Basis Path "
-        elif self.analyzer.enumCommand == 1:
-            pathList = self.itemToAnalyze.bestPaths
-            label = "+ Best Path "
-        elif self.analyzer.enumCommand == 2:
-            pathList = self.itemToAnalyze.worstPaths
-            label = "+ Worst Path "
-        elif self.analyzer.enumCommand == 3:
-            pathList = self.itemToAnalyze.randomPaths
-            label = "+ Random Path "
-        elif self.analyzer.enumCommand == 4 or self.analyzer.enumCommand == 5:
-            pathList = self.itemToAnalyze.allPaths
-            label = "+ Path "
+        itemToAnalyze = self.itemToAnalyze
+        if enumCommand == 0:
+            itemToAnalyze.numBasisPaths = 0
+        pathListName, label = PATH_ITEM_SPECS[enumCommand]
+        pathList = getattr(itemToAnalyze, pathListName)
+
+        if not paths:
+            self.signals.doneAnalyzing.emit()
+            return
 
+        # Look up the values that stay the same for every path only once.
+        isBasis = enumCommand == 0
+        if enumCommand in (1, 2, 3):
+            # Stop consuming paths once the number requested is reached.
+            paths = islice(paths, self.analyzer.numPaths)
+        pathOrigLocation = itemToAnalyze.preprocessedFileItem.origLocation
+        mainWindow = self.analyzer.mainWindow
+        origLocation = itemToAnalyze.origLocation
+        cancelRequested = self.cancelRequested.is_set
+        emitBatch = self.signals.updateGuiBatch.emit
+
+        pathItems = []
         for path in paths:
-            if ((caseNumber > self.analyzer.numPaths and
-                 self.analyzer.enumCommand in [1, 2, 3])):
+            if cancelRequested():
                 break
-            if self.analyzer.enumCommand == 0:
-                self.itemToAnalyze.numBasisPaths += 1
+            if isBasis:
+                itemToAnalyze.numBasisPaths += 1
                 toWrite.append(path)
 
             caseData = ("Assignments:\n%s\n\nPredicted Value:\n%s\n\n"
@@ -1473,25 +1532,32 @@ class WorkerThread(QtCore.QThread):
                          path.getPredictedValue(),
                          path.getMeasuredValue()))
 
-            preprocessedFileItem = self.itemToAnalyze.preprocessedFileItem
             pathItem = FileItem(
                 "%s%d" % (label, caseNumber),
-                preprocessedFileItem.origLocation,
+                pathOrigLocation,
                 caseData,
-                self.analyzer.mainWindow,
+                mainWindow,
                 assign=True
             )
-            pathItem.originalName = self.itemToAnalyze.origLocation
-            pathItem.setParent(self.itemToAnalyze)
+            pathItem.originalName = origLocation
+            pathItem.setParent(itemToAnalyze)
             pathList.append(pathItem)
             pathItem.setHighlightPath(path)
             pathItem.setAnalyze(False)
 
             # self.signals.progress.emit(caseNumber)
             caseNumber += 1
-            self.signals.updateGui.connect(self.gui.slotUpdateGui)
-            self.signals.updateGui.emit(pathItem)
-        # if self.analyzer.enumCommand == 0:
+            pathItems.append(pathItem)
+            if len(pathItems) >= PATH_ITEM_BATCH_SIZE:
+                emitBatch(pathItems)
+                pathItems = []
+        # Display the items for the paths that are already in the path list,
+        # even if the analysis was cancelled.
+        if pathItems:
+            self.signals.updateGuiBatch.emit(pathItems)
+        if self.cancelRequested.is_set():
+            return
+        # if enumCommand == 0:
             # self.itemToAnalyze.analyzer.writeBasisPathsToFiles(toWrite)
         self.signals.doneAnalyzing.emit()
 
@@ -1506,33 +1572,93 @@ class WorkerThread(QtCore.QThread):
         self.itemToAnalyze = item
 
 
+class FileReaderThreadSignals(QtCore.QObject):
+    doneReading = Signal(object, object)
+    printToConsole = Signal(str)
+
+
+class FileReaderThread(QtCore.QThread):
+    """Thread that reads the contents of the file to be analyzed
+    in a GameTime project, and emits the contents when it is done.
+    If the file cannot be read, the contents emitted are `None`.
+    """
+    def __init__(self, projectConfig):
+        super(FileReaderThread, self).__init__()
+        self.projectConfig = projectConfig
+        self.signals = FileReaderThreadSignals()
+
+    def run(self):
+        fileText = None
+        locationOrigFile = self.projectConfig.locationOrigFile
+        try:
+            with open(locationOrigFile, "r") as origFileHandler:
+                fileText = origFileHandler.read()
+        except EnvironmentError as err:
+            self.signals.printToConsole.emit(
+                "I/O error({0}): {1}.".format(err.errno, err.strerror)
+            )
+        except Exception as err:
+            self.signals.printToConsole.emit("Error({0})".format(err))
+        self.signals.doneReading.emit(self.projectConfig, fileText)
+
+
+class UpdateCheckThreadSignals(QtCore.QObject):
+    doneChecking = Signal(bool, object)
+
+
+class UpdateCheckThread(QtCore.QThread):
+    """Thread that checks if an update to the current version of GameTime
+    is available, and emits the result of the check when it is done.
+    """
+    def __init__(self):
+        super(UpdateCheckThread, self).__init__()
+        self.signals = UpdateCheckThreadSignals()
+
+    def run(self):
+        updateAvailable, latestVersionInfo = isUpdateAvailable()
+        self.signals.doneChecking.emit(updateAvailable, latestVersionInfo)
+
+
 def showMainWindow():
-    """Creates the application for the GUI and shows the main window."""
-    from gametime.defaults import logger
+    """Creates the application for the GUI, if it does not exist yet,
+    and shows the main window until it is closed.
+
+    Returns:
+        Exit code of the event loop of the application.
+    """
     logger.info("Starting up the GameTime GUI...")
 
-    # One application created for the GUI.
-    # TODO (jokotker): What is happening here?
-    # Maintains the main window.
-    app_gametime = QtGui.QApplication(sys.argv)
+    # Only one application can exist in a process, and it maintains
+    # the main window. Reuse the application if it was already created.
+    app_gametime = (QtGui.QApplication.instance() or
+                    QtGui.QApplication(sys.argv))
 
     # Start an instance of the GUI.
     gui_instance = GameTimeGui()
     gui_instance.show()
 
     # Execute the application.
-    sys.exit(app_gametime.exec_())
+    exitCode = app_gametime.exec_()
     logger.info("GameTime GUI closed.")
+    return exitCode
 
 def startGui():
+    """Prepares and starts the graphical user interface to GameTime."""
+    if os.name != "nt":
+        # The batch file can only be run on Windows. Elsewhere, the
+        # environment is already prepared, so show the GUI in this process.
+        return showMainWindow()
+
     # Construct the location of the directory that contains
     # the batch file that prepares and starts
     # the GameTime graphical user interface.
     from gametime.defaults import sourceDir
     guiInitBatchFile = os.path.join(sourceDir,
                                     os.path.join("bin", "gametime-gui.bat"))
-    subprocess.call([guiInitBatchFile], shell=True)
+    # Run the batch file through the command interpreter directly,
+    # rather than through an additional shell.
+    return subprocess.call(["cmd", "/c", guiInitBatchFile])
 
 
 if __name__ == "__main__":
-    showMainWindow()
+    sys.exit(showMainWindow())
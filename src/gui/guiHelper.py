@@ -298,6 +298,32 @@ class FileItem(object):
         if child.origLocation == " (Preprocessed)":
             self.preprocessedFileItem = None
 
+    def removeChildren(self, children):
+        """Remove the child FileItems provided, both from this FileItem
+        and from the list of files in the main window. The children are
+        removed together, and the list of files is repainted only once.
+        """
+        toRemove = set(children)
+        if not toRemove:
+            return
+        for itemList in [self.children, self.basisPaths, self.worstPaths,
+                         self.bestPaths, self.randomPaths, self.allPaths]:
+            itemList[:] = [item for item in itemList if item not in toRemove]
+        if any(child.origLocation == " (Preprocessed)" for child in toRemove):
+            self.preprocessedFileItem = None
+
+        # Remove the children from the list of files starting from the last
+        # one, so that fewer of the items in the list have their display
+        # indices updated after each removal.
+        fileList = self.fileList
+        fileList.setUpdatesEnabled(False)
+        try:
+            for child in sorted(toRemove, key=lambda item: item.displayIndex,
+                                reverse=True):
+                fileList.removeItem(child)
+        finally:
+            fileList.setUpdatesEnabled(True)
+
     def setParent(self, sourceFileItem):
         """Set the parent of this FileItem."""
         oldName = self.displayName
@@ -11,13 +11,69 @@ for details on the GameTime license and authors.
 """
 
 
+from operator import attrgetter
+
 import numpy as np
 
 from defaults import logger
 from gametimeError import GameTimeError
 
 
-def computeHistogram(paths, bins=10, range=None, measured=False):
+def extractPathValues(paths, measured=False):
+    """Extracts the values of a list of feasible paths generated by GameTime
+    into a single array, which can then be shared by every computation that
+    needs these values, instead of each computation building its own list.
+
+    Arguments:
+        paths:
+            List of feasible paths generated by GameTime, each
+            represented by a :class:`~gametime.path.Path` object.
+        measured:
+            `True` if, and only if, the values to extract are
+            the measured values of the feasible paths.
+
+    Returns:
+        One-dimensional :class:`~numpy.ndarray` of the values of
+        the feasible paths, in the same order as the list provided.
+    """
+    getValue = attrgetter("measuredValue" if measured else "predictedValue")
+    return np.fromiter((getValue(path) for path in paths),
+                       dtype=np.float64, count=len(paths))
+
+class PathArray(object):
+    """Maintains the values of a list of feasible paths generated by
+    GameTime as contiguous arrays, one for each kind of value, so that
+    the values are extracted from the :class:`~gametime.path.Path`
+    objects once and then shared by every computation that needs them.
+
+    Attributes:
+        paths:
+            List of feasible paths generated by GameTime, each
+            represented by a :class:`~gametime.path.Path` object,
+            whose values will be maintained.
+    """
+
+    def __init__(self, paths):
+        #: List of the :class:`~gametime.path.Path` objects whose
+        #: values are maintained by this object.
+        self.paths = paths
+
+        #: Array of the predicted values of the feasible paths.
+        self.predicted = extractPathValues(paths)
+
+        #: Array of the measured values of the feasible paths, or `None`
+        #: if the feasible paths have not been measured yet.
+        self.measured = None
+
+    def updateMeasured(self):
+        """Extracts the measured values of the feasible paths, after
+        the values of the :class:`~gametime.path.Path` objects have been
+        measured on a simulator.
+        """
+        self.measured = extractPathValues(self.paths, measured=True)
+
+def computeHistogram(paths, bins=10, range=None, measured=False,
+                     values=None):
     """Computes a histogram from the values of a list of
     feasible paths generated by GameTime. This function is
     a wrapper around the function :func:`~numpy.histogram` from
@@ -37,17 +93,22 @@ def computeHistogram(paths, bins=10, range=None, measured=False):
         measured:
             `True` if, and only if, the values that will be used for
             the histogram are the measured values of the feasible paths.
+        values:
+            Array of the values of the feasible paths, as returned by
+            :func:`extractPathValues`. If provided, these values are
+            used instead of being extracted again from `paths`.
 
     Returns:
         Tuple, whose first element is an array of the values of
         the histogram, and whose second element is an array of
         the left edges of the bins.
     """
-    pathValues = [path.measuredValue if measured else path.predictedValue
-                  for path in paths]
-    return np.histogram(pathValues, bins=bins, range=range)
+    if values is None:
+        values = extractPathValues(paths, measured)
+    return np.histogram(values, bins=bins, range=range)
 
-def writeHistogramToFile(location, paths, bins=10, range=None, measured=False):
+def writeHistogramToFile(location, paths, bins=10, range=None, measured=False,
+                         values=None):
     """Computes a histogram from the values of a list of
     feasible paths generated by GameTime, and writes the histogram
     to a file. Each line of the file has the left edge of each bin
@@ -69,10 +130,14 @@ def writeHistogramToFile(location, paths, bins=10, range=None, measured=False):
         measured:
             `True` if, and only if, the values that will be used for
             the histogram are the measured values of the feasible paths.
+        values:
+            Array of the values of the feasible paths, as returned by
+            :func:`extractPathValues`. If provided, these values are
+            used instead of being extracted again from `paths`.
     """
     logger.info("Creating histogram...")
 
-    hist, binEdges = computeHistogram(paths, bins, range, measured)
+    hist, binEdges = computeHistogram(paths, bins, range, measured, values)
     try:
         histogramFileHandler = open(location, "w")
     except EnvironmentError as e:
@@ -81,7 +146,9 @@ def writeHistogramToFile(location, paths, bins=10, range=None, measured=False):
         raise GameTimeError(errMsg)
     else:
         with histogramFileHandler:
-            for binEdge, sample in zip(binEdges, hist):
-                histogramFileHandler.write("%s\t%s\n" % (binEdge, sample))
+            histogramFileHandler.write("".join(
+                "%s\t%s\n" % (binEdge, sample)
+                for binEdge, sample in zip(binEdges, hist)
+            ))
 
     logger.info("Histogram created.")
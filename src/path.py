@@ -603,11 +603,9 @@ class Path(object):
             that would drive an execution of the code under analysis
             along this path.
         """
-        result = []
-        for key in sorted(self.assignments.keys()):
-            result.append("%s = %s;" % (key, self.assignments[key]))
-            result.append("\n")
-        return "".join(result)
+        assignments = self.assignments
+        return "".join(["%s = %s;\n" % (key, assignments[key])
+                        for key in sorted(assignments)])
 
     def writeAssignmentsToFile(self, location):
         """
@@ -40,17 +40,22 @@ class PathType(object):
     #: All feasible paths, arranged in increasing order of value.
     ALL_INCREASING = 4
 
+    #: Dictionary that maps each path type to its one-word description.
+    _descriptions = {
+        WORST_CASE: "worst",
+        BEST_CASE: "best",
+        RANDOM: "random",
+        ALL_DECREASING: "all-dec",
+        ALL_INCREASING: "all-inc",
+    }
+
     @staticmethod
     def getDescription(pathType):
         """
         Returns:
             One-word description of the path type provided.
         """
-        return ("worst" if pathType is PathType.WORST_CASE else
-                "best" if pathType is PathType.BEST_CASE else
-                "random" if pathType is PathType.RANDOM else
-                "all-dec" if pathType is PathType.ALL_DECREASING else
-                "all-inc" if pathType is PathType.ALL_INCREASING else "")
+        return PathType._descriptions.get(pathType, "")
 
 
 class PathGenerator(object):
@@ -155,6 +155,11 @@ class ProjectConfiguration(object):
             solve integer linear programs to generate candidate paths.
         debugConfig:
             Debugging configuration.
+        smtSolverTimeout:
+            Number of seconds after which the satisfiability of an SMT
+            query is considered unknown, or None if the satisfiability
+            of an SMT query is checked without a time limit. This is
+            currently only supported by Boolector.
     """
 
     def __init__(self, locationFile, func, smtSolverName,
@@ -163,7 +168,8 @@ class ProjectConfiguration(object):
                  maximumErrorScaleFactor = 10,
                  determinantThreshold=0.001, maxInfeasiblePaths=100,
                  modelAsNestedArrays=False, preventBasisRefinement=False,
-                 ilpSolverName="", debugConfig=None):
+                 ilpSolverName="", debugConfig=None,
+                 smtSolverTimeout=None):
         ### FILE INFORMATION ###
         # Location of the directory that contains the file to be analyzed.
         self.locationOrigDir = ""
@@ -258,6 +264,10 @@ class ProjectConfiguration(object):
         # a 2-barycentric spanner.
         self.PREVENT_BASIS_REFINEMENT = preventBasisRefinement
 
+        # Number of seconds after which the satisfiability of an SMT query
+        # is considered unknown, if any.
+        self.SMT_SOLVER_TIMEOUT = smtSolverTimeout
+
         #TODO: comment here
         self.OVER_COMPLETE_BASIS = False
         self.OB_EXTRACTION = False
@@ -413,7 +423,9 @@ class ProjectConfiguration(object):
                 satSolverName = satSolverName.split("-")[-1]
                 boolectorSatSolver = \
                 SatSolver.getSatSolver(satSolverName)
-                self.smtSolver = BoolectorSolver(boolectorSatSolver)
+                self.smtSolver = \
+                BoolectorSolver(boolectorSatSolver,
+                                timeout=self.SMT_SOLVER_TIMEOUT)
 
                 from smt.parsers.boolectorModelParser \
                 import BoolectorModelParser
@@ -545,6 +557,13 @@ class ProjectConfiguration(object):
         smtSolverNode.appendChild(xmlDoc.createTextNode(str(self.smtSolver)))
         analysisNode.appendChild(smtSolverNode)
 
+        if self.SMT_SOLVER_TIMEOUT is not None:
+            smtSolverTimeoutNode = xmlDoc.createElement("smt-solver-timeout")
+            smtSolverTimeoutNode.appendChild(
+                xmlDoc.createTextNode("%d" % self.SMT_SOLVER_TIMEOUT)
+            )
+            analysisNode.appendChild(smtSolverTimeoutNode)
+
         # Create the XML node that stores the debug flags.
         debugNode = xmlDoc.createElement("debug")
         projectRoot.appendChild(debugNode)
@@ -730,6 +749,7 @@ def readProjectConfigFile(location):
     determinantThreshold, maxInfeasiblePaths = 0.001, 100
     modelAsNestedArrays, preventBasisRefinement = False, False
     ilpSolverName, smtSolverName = "", ""
+    smtSolverTimeout = None
 
     # Process information about the file to be analyzed.
     fileNode = (projectConfigDom.getElementsByTagName("file"))[0]
@@ -797,6 +817,9 @@ def readProjectConfigFile(location):
                 ilpSolverName = nodeText
             elif nodeTag == "smt-solver":
                 smtSolverName = nodeText
+            elif nodeTag == "smt-solver-timeout":
+                if nodeText != "":
+                    smtSolverTimeout = int(nodeText)
             else:
                 raise GameTimeError("Unrecognized tag: %s" % nodeTag)
 
@@ -856,7 +879,8 @@ def readProjectConfigFile(location):
                                          maxInfeasiblePaths,
                                          modelAsNestedArrays,
                                          preventBasisRefinement,
-                                         ilpSolverName, debugConfig)
+                                         ilpSolverName, debugConfig,
+                                         smtSolverTimeout)
     logger.info("Successfully loaded project.")
     logger.info("")
     return projectConfig
@@ -16,20 +16,129 @@ import os
 import re
 import shutil
 import subprocess
+import sys
 from tempfile import NamedTemporaryFile
 
 from gametime.defaults import config
-from gametime.fileHelper import createDir, removeFiles
+from gametime.fileHelper import createDir
 from gametime.gametimeError import GameTimeError
 from gametime.simulators.simulator import Simulator
 
 
+#: Prefix of the command that runs the cross-compiler. On Cygwin, the
+#: cross-compiler is run in a terminal that stays open if the compilation
+#: fails. This command prefix was suggested by
+#: http://sharats.me/the-ever-useful-and-neat-subprocess-module.html.
+_compileCmdPrefix = (["mintty", "--hold", "error", "--exec"]
+                     if sys.platform == "cygwin" else [])
+
+#: Regular expression that matches the symbols, in the symbol table of
+#: a binary file, of the labels that mark the start and the end of
+#: the code under analysis, keyed by the name of the label. Only symbols
+#: in the text section match, so that the `end` symbol that linker scripts
+#: define for the end of the bss section is not mistaken for the label.
+_labelRegex = re.compile(r"^(?P<value>[0-9a-f]+) [tT] "
+                         r"(?P<key>start|end)\r?$", re.MULTILINE)
+
+#: Regular expression that matches the instruction fetches in the output
+#: of the simulator, keyed by the address of the instruction fetched.
+#: The value is the index of the instruction.
+_fetchRegex = re.compile(r"T0\|FE\|(?P<value>[0-9]+)> Fetched from PC: "
+                         r"0x(?P<key>[0-9a-f]+) Binary: 0x[0-9a-f]+")
+
+#: Regular expression that matches the cycle counts in the output of
+#: the simulator, keyed by the index of the instruction. The value is
+#: the cycle count after the write-back of the instruction.
+_cycleCountRegex = re.compile(r"T0\|WB\|(?P<key>[0-9]+)> "
+                              r"Thread virtual cycle count: (?P<value>[0-9]+)")
+
+
+def _addFirstMatches(regex, text, firstMatches):
+    """Maps each string matched by the `key` group of the regular
+    expression provided to the string matched by the `value` group
+    in the first match of that key, unless the key is already mapped.
+
+    Arguments:
+        regex:
+            Compiled regular expression with the groups `key` and `value`.
+        text:
+            Text to search.
+        firstMatches:
+            Dictionary to add the matches to.
+    """
+    for match in regex.finditer(text):
+        key = match.group("key")
+        if key not in firstMatches:
+            firstMatches[key] = match.group("value")
+
+
+def _getMatch(matches, key, description):
+    """
+    Arguments:
+        matches:
+            Dictionary filled in by :func:`_addFirstMatches`.
+        key:
+            Key to look up.
+        description:
+            Description of the value that is looked up, which is
+            used in the error message if the value was not found.
+
+    Returns:
+        Value that the key is mapped to.
+    """
+    try:
+        return matches[key]
+    except KeyError:
+        errMsg = "Unable to find %s." % description
+        raise GameTimeError(errMsg)
+
+
 class PtarmSimulator(Simulator):
-    """Maintains a representation of the PTARM simulator."""
+    """Maintains a representation of the PTARM simulator.
+
+    Measurements require the GNU ARM toolchain, in the directory
+    configured as `SIMULATOR_TOOL_GNU_ARM`, to provide `arm-elf-gcc`,
+    `arm-elf-objdump`, `arm-elf-nm` and `arm-elf-objcopy`.
+    """
 
     def __init__(self, projectConfig):
         super(PtarmSimulator, self).__init__(projectConfig, "PTARM")
 
+        #: Command, as a list of arguments, that runs the cross-compiler
+        #: for the ARM target, without the locations of the input and
+        #: the output files, which change with every test case.
+        self._compileCmd = self._createCompileCmd()
+
+    def _createCompileCmd(self):
+        """
+        Returns:
+            Command, as a list of arguments, that runs the cross-compiler
+            for the ARM target (arm-elf-gcc), without the locations of
+            the file to compile and of the binary output file.
+        """
+        projectConfig = self.projectConfig
+
+        compileCmd = list(_compileCmdPrefix)
+
+        compileCmd.append("%s/bin/arm-elf-gcc" % config.SIMULATOR_TOOL_GNU_ARM)
+
+        compileCmd.append("-I./")
+        for includedFileLocation in projectConfig.included:
+            compileCmd.append("-I%s" % includedFileLocation)
+        compileCmd.append("-I%s/include" % config.SIMULATOR_TOOL_GNU_ARM)
+        compileCmd.append("-I%s/include" % config.SIMULATOR_PTARM)
+        compileCmd.append("-I%s/tests/include" % config.SIMULATOR_PTARM)
+
+        compileCmd.append("-nostartfiles")
+        compileCmd.append("-g")
+        compileCmd.append("-mcpu=arm7di")
+        compileCmd.append("-DSTACK_INIT=0x40100000")
+        compileCmd.append("%s/tests/crt/crt0.S" % config.SIMULATOR_PTARM)
+        compileCmd.append("-Ttext")
+        compileCmd.append("0x40000000")
+        compileCmd.append("-L%s/lib" % config.SIMULATOR_TOOL_GNU_ARM)
+        return compileCmd
+
     def _createTestCaseFile(self, path):
         """Creates a temporary C file that contains the test case that
         would drive an execution of the code under analysis along
@@ -45,75 +154,34 @@ class PtarmSimulator(Simulator):
             Location of the temporary C file that contains the test case.
         """
         projectConfig = self.projectConfig
-
-        contents = []
-        contents.append("#include \"%s\"" % projectConfig.locationOrigFile)
-        contents.append("")
-        contents.append("int %s(void)" % config.ANNOTATION_SIMULATE)
-        contents.append("{")
-        for key in sorted(path.assignments.keys()):
-            contents.append("  %s = %s;" % (key, path.assignments[key]))
-        contents.append("  asm(\"start:\");")
-        contents.append("  %s();" % projectConfig.func)
-        contents.append("  asm(\"end:\");")
-        contents.append("  return 0;")
-        contents.append("}")
-        contents.append("")
+        assignments = path.assignments
 
         testCaseFileHandler = NamedTemporaryFile(suffix="-gt.c",
                                                  dir=self._measurementDir,
                                                  delete=False)
         with testCaseFileHandler:
-            testCaseFileHandler.write("\n".join(contents))
+            write = testCaseFileHandler.write
+            write("#include \"%s\"\n\nint %s(void)\n{\n" %
+                  (projectConfig.locationOrigFile, config.ANNOTATION_SIMULATE))
+            write("".join(["  %s = %s;\n" % (key, assignments[key])
+                           for key in sorted(assignments)]))
+            write("  asm(\"start:\");\n  %s();\n  asm(\"end:\");\n"
+                  "  return 0;\n}\n" % projectConfig.func)
         return testCaseFileHandler.name
 
-    def _compileFile(self, testCaseFileLocation):
+    def _compileFile(self, testCaseFileLocation, outFileLocation):
         """Compiles the temporary file that contains a test case
         using the cross-compiler for the ARM target (arm-elf-gcc).
 
         Arguments:
             testCaseFileLocation:
                 Location of the temporary file that contains the test case.
-
-        Returns:
-            Location of the binary output file produced by the compilation.
+            outFileLocation:
+                Location of the binary output file to be produced by
+                the compilation.
         """
-        projectConfig = self.projectConfig
-
-        outFileLocationNoExt, _ = os.path.splitext(testCaseFileLocation)
-        outFileLocation = "%s.out" % outFileLocationNoExt
-
-        compileCmd = []
-
-        # This command prefix was suggested by
-        # http://sharats.me/the-ever-useful-and-neat-subprocess-module.html.
-        compileCmd.append("mintty")
-        compileCmd.append("--hold")
-        compileCmd.append("error")
-        compileCmd.append("--exec")
-
-        compileCmd.append("%s/bin/arm-elf-gcc" % config.SIMULATOR_TOOL_GNU_ARM)
-
-        compileCmd.append("-I./")
-        for includedFileLocation in projectConfig.included:
-            compileCmd.append("-I'%s'" % includedFileLocation)
-        compileCmd.append("-I'%s/include'" % config.SIMULATOR_TOOL_GNU_ARM)
-        compileCmd.append("-I'%s/include'" % config.SIMULATOR_PTARM)
-        compileCmd.append("-I'%s/tests/include'" % config.SIMULATOR_PTARM)
-
-        compileCmd.append("-nostartfiles")
-        compileCmd.append("-g")
-        compileCmd.append("-mcpu=arm7di")
-        compileCmd.append("-DSTACK_INIT=0x40100000")
-        compileCmd.append("'%s/tests/crt/crt0.S'" % config.SIMULATOR_PTARM)
-        compileCmd.append("-Ttext")
-        compileCmd.append("0x40000000")
-        compileCmd.append("-L'%s/lib'" % config.SIMULATOR_TOOL_GNU_ARM)
-
-        compileCmd.append(testCaseFileLocation)
-
-        compileCmd.append("-o")
-        compileCmd.append(outFileLocation)
+        compileCmd = self._compileCmd + [testCaseFileLocation,
+                                         "-o", outFileLocation]
 
         returnCode = subprocess.call(compileCmd)
         if returnCode:
@@ -121,23 +189,17 @@ class PtarmSimulator(Simulator):
                       "the ARM target (arm-elf-gcc).") 
             raise GameTimeError(errMsg)
 
-        return outFileLocation
+    def _dumpAsmFile(self, outFileLocation, asmFileLocation):
+        """Writes the assembler contents of the binary file produced by
+        the compilation of a temporary file that contains a test case.
 
-    def _dumpAsmFile(self, outFileLocation):
-        """
         Arguments:
             outFileLocation:
                 Location of the binary file produced by the compilation of
                 a temporary file that contains a test case.
-
-        Returns:
-            Location of the file that contains the assembler contents
-            of the binary file produced by the compilation of a temporary
-            file that contains a test case.
-        """ 
-        asmFileLocationNoExt, _ = os.path.splitext(outFileLocation)
-        asmFileLocation = "%s.asm" % asmFileLocationNoExt
-
+            asmFileLocation:
+                Location of the file to write the assembler contents to.
+        """
         dumpCmd = []
         dumpCmd.append("%s/bin/arm-elf-objdump" %
                        config.SIMULATOR_TOOL_GNU_ARM)
@@ -153,17 +215,50 @@ class PtarmSimulator(Simulator):
         with open(asmFileLocation, "w") as asmFile:
             asmFile.write(dumpCmdOutput)
 
-        return asmFileLocation
+    def _findLabelAddresses(self, outFileLocation):
+        """Reads the addresses of the labels that mark the start and
+        the end of the code under analysis from the symbol table of
+        the binary file produced by the compilation of a temporary file
+        that contains a test case.
+
+        Arguments:
+            outFileLocation:
+                Location of the binary file produced by the compilation of
+                a temporary file that contains a test case.
 
-    def _convertToSrec(self, outFileLocation):
-        """Converts the binary file produced by the compilation
+        Returns:
+            Tuple of the addresses of the start and the end labels,
+            as hexadecimal strings.
+        """
+        nmCmd = []
+        nmCmd.append("%s/bin/arm-elf-nm" % config.SIMULATOR_TOOL_GNU_ARM)
+        nmCmd.append(outFileLocation)
+
+        nmCmdOutput = subprocess.check_output(nmCmd)
+
+        labelAddresses = {}
+        _addFirstMatches(_labelRegex, nmCmdOutput, labelAddresses)
+        startAddress = _getMatch(labelAddresses, "start",
+                                 "the start label in the binary file")
+        endAddress = _getMatch(labelAddresses, "end",
+                               "the end label in the binary file")
+        return startAddress, endAddress
+
+    def _startSrecConversion(self, outFileLocation):
+        """Starts converting the binary file produced by the compilation
         of a temporary file that contains a test case to
-        the SREC format executed by the simulator.
+        the SREC format executed by the simulator. The conversion runs
+        in the background until it is finished with
+        :func:`_finishSrecConversion`.
 
         Arguments:
             outFileLocation:
                 Location of the binary file produced by the compilation
                 of a temporary file that contains a test case.
+
+        Returns:
+            :class:`~subprocess.Popen` object for the process that
+            performs the conversion.
         """
         srecFileLocation = os.path.join(self._measurementDir, "thread0.srec")
 
@@ -175,7 +270,18 @@ class PtarmSimulator(Simulator):
         srecCmd.append(outFileLocation)
         srecCmd.append(srecFileLocation)
 
-        returnCode = subprocess.call(srecCmd)
+        return subprocess.Popen(srecCmd)
+
+    def _finishSrecConversion(self, srecProcess):
+        """Waits for the conversion of a binary file to the SREC format
+        executed by the simulator to finish.
+
+        Arguments:
+            srecProcess:
+                :class:`~subprocess.Popen` object for the process that
+                performs the conversion.
+        """
+        returnCode = srecProcess.wait()
         if returnCode:
             errMsg = ("Error in converting the binary file produced by "
                       "compilation to the SREC format executed by "
@@ -191,29 +297,26 @@ class PtarmSimulator(Simulator):
         evecSrecCopyLocation = os.path.join(self._measurementDir, "evec.srec")
         shutil.copy(EVEC_SREC_LOCATION, evecSrecCopyLocation)
 
-    def _runSimulatorAndParseOutput(self, asmFileLocation):
+    def _runSimulatorAndParseOutput(self, startAddress, endAddress,
+                                    pretOutputFileLocation):
         """Runs the simulator on a test case and dumps the output to
         a temporary file in the temporary directory used for simulation.
         This method then parses this output to determine the cycle count
         of the simulation.
 
         Arguments:
-            asmFileLocation:
-                Location of the file that contains the assembler contents
-                of the binary file produced by the compilation of a temporary
-                file that contains the test case.
+            startAddress:
+                Address of the label that marks the start of the code
+                under analysis, as a hexadecimal string.
+            endAddress:
+                Address of the label that marks the end of the code
+                under analysis, as a hexadecimal string.
+            pretOutputFileLocation:
+                Location of the temporary file to dump the output to.
 
         Returns:
             Cycle count of a simulation of the test case.
         """
-        # Get the start/end address based on labels in the generated ASM file.
-        with open(asmFileLocation, "r") as asmFile:
-            asmLines = asmFile.read()
-            match = re.search("([0-9a-f]+) <start>:", asmLines)
-            startAddress = match.group(1)
-            match = re.search("([0-9a-f]+) <end>:", asmLines)
-            endAddress = match.group(1)
-
         # Construct the location of the PRET binary file.
         PRET_LOCATION = "%s/bin/pret" % config.SIMULATOR_PTARM
 
@@ -224,33 +327,36 @@ class PtarmSimulator(Simulator):
         pretExecCmd.append("-d")
         pretExecCmd.append("wfD1")
 
-        pretOutput = subprocess.check_output(pretExecCmd)
-
-        # Write the output to a file for later perusal.
-        pretOutputFileLocationNoExt, _ = os.path.splitext(asmFileLocation)
-        pretOutputFileLocation = "%s.pret.out" % pretOutputFileLocationNoExt
+        # Write the output to a file for later perusal, line by line
+        # as the simulator produces it. At the same time, parse the output
+        # for the index of the first instruction fetched from each address,
+        # and for the cycle count at each index.
+        fetchIndices = {}
+        cycleCounts = {}
+        pretProcess = subprocess.Popen(pretExecCmd, stdout=subprocess.PIPE)
         with open(pretOutputFileLocation, "w") as pretOutputFile:
-            pretOutputFile.write("".join(pretOutput))
+            for pretOutputLine in pretProcess.stdout:
+                pretOutputFile.write(pretOutputLine)
+                _addFirstMatches(_fetchRegex, pretOutputLine, fetchIndices)
+                _addFirstMatches(_cycleCountRegex, pretOutputLine,
+                                 cycleCounts)
+        if pretProcess.wait():
+            errMsg = "Error in running the simulator (pret)."
+            raise GameTimeError(errMsg)
 
-        # Parse the output data for the start and end cycle counts.
         # Find the start/end address and extract the start/end index.
-        addressString = (r"T0\|FE\|([0-9]+)> Fetched from PC: 0x{} "
-                          "Binary: 0x[0-9a-f]+")
-        startString = addressString.format(startAddress)
-        match = re.search(startString, pretOutput)
-        startIndex = match.group(1)
-        endString = addressString.format(endAddress)
-        match = re.search(endString, pretOutput)
-        endIndex = match.group(1)
+        startIndex = _getMatch(fetchIndices, startAddress,
+                               "the start address in the simulator output")
+        endIndex = _getMatch(fetchIndices, endAddress,
+                             "the end address in the simulator output")
 
         # Use the start/end index to extract the start/end cycle count.
-        cycleString = r"T0\|WB\|{}> Thread virtual cycle count: ([0-9]+)"
-        startString = cycleString.format(startIndex)
-        match = re.search(startString, pretOutput)
-        startCycle = int(match.group(1))
-        endString = cycleString.format(endIndex)
-        match = re.search(endString, pretOutput)
-        endCycle = int(match.group(1))
+        startCycle = int(_getMatch(cycleCounts, startIndex,
+                                   "the start cycle count in "
+                                   "the simulator output"))
+        endCycle = int(_getMatch(cycleCounts, endIndex,
+                                 "the end cycle count in "
+                                 "the simulator output"))
 
         totalCycles = endCycle - startCycle
         return totalCycles
@@ -259,8 +365,7 @@ class PtarmSimulator(Simulator):
         """Removes the temporary files and directory that were created
         during the most recent simulation, if any.
         """
-        removeFiles([".*"], self._measurementDir)
-        os.removedirs(self._measurementDir)
+        shutil.rmtree(self._measurementDir, ignore_errors=True)
 
     def measure(self, path):
         """
@@ -282,11 +387,32 @@ class PtarmSimulator(Simulator):
             # http://chess.eecs.berkeley.edu/pret/src/ptarm-1.0/\
             # ptarm_simulator.html#%5B%5BCompiling%20Programs%5D%5D.
             testCaseFileLocation = self._createTestCaseFile(path)
-            outFileLocation = self._compileFile(testCaseFileLocation)
-            asmFileLocation = self._dumpAsmFile(outFileLocation)
-            self._convertToSrec(outFileLocation)
-            self._copyEvecSrec()
-            cycleCount = self._runSimulatorAndParseOutput(asmFileLocation)
+
+            # The other temporary files are named after the test case file.
+            locationNoExt, _ = os.path.splitext(testCaseFileLocation)
+            outFileLocation = "%s.out" % locationNoExt
+            asmFileLocation = "%s.asm" % locationNoExt
+            pretOutputFileLocation = "%s.pret.out" % locationNoExt
+
+            self._compileFile(testCaseFileLocation, outFileLocation)
+
+            # The conversion to the SREC format only needs the binary file,
+            # so it runs while the binary file is inspected.
+            srecProcess = self._startSrecConversion(outFileLocation)
+            try:
+                startAddress, endAddress = \
+                    self._findLabelAddresses(outFileLocation)
+                if self.projectConfig.debugConfig.KEEP_SIMULATOR_OUTPUT:
+                    # The assembler contents are only kept for perusal.
+                    self._dumpAsmFile(outFileLocation, asmFileLocation)
+                self._copyEvecSrec()
+            except:
+                srecProcess.wait()
+                raise
+            self._finishSrecConversion(srecProcess)
+            cycleCount = self._runSimulatorAndParseOutput(
+                startAddress, endAddress, pretOutputFileLocation
+            )
         except EnvironmentError as e:
             errMsg = ("Error in measuring the cycle count of a path "
                       "when simulated on the PTARM simulator: %s" % e)
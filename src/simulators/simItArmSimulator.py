@@ -12,11 +12,12 @@ for details on the GameTime license and authors.
 
 
 import os
+import tarfile
 from tempfile import NamedTemporaryFile
 
 from fabric.api import cd, env, execute, put, run
 
-from gametime.defaults import config
+from gametime.defaults import config, logger
 from gametime.fileHelper import createDir
 from gametime.gametimeError import GameTimeError
 from gametime.simulators.simulator import Simulator
@@ -34,6 +35,10 @@ class SimItArmSimulator(Simulator):
                             config.TEMP_SUFFIX)
         self._remoteMeasurementDir = os.path.join("/tmp/%s" % dirName)
 
+        #: Prefix of the locations of the files in the temporary directory
+        #: on the remote machine.
+        self._remoteMeasurementPrefix = "%s/" % self._remoteMeasurementDir
+
     def _getRemotePath(self, location):
         """
         Arguments:
@@ -46,8 +51,7 @@ class SimItArmSimulator(Simulator):
             in the temporary directory on the remote machine created
             for the purposes of simulation and measurement.
         """
-        return "%s/%s" % (self._remoteMeasurementDir,
-                          os.path.basename(location))
+        return self._remoteMeasurementPrefix + os.path.basename(location)
 
     def _transferFile(self, location):
         """
@@ -64,7 +68,38 @@ class SimItArmSimulator(Simulator):
                      mirror_local_mode=True)
         if len(result.failed) > 0:
             errMsg = ("Error in uploading the file located at %s to "
-                      "a remote machine: %s" % (location, e))
+                      "a remote machine." % location)
+            raise GameTimeError(errMsg)
+
+    def _transferFiles(self, locations):
+        """
+        Transfers the files at the locations provided into the temporary
+        directory on the remote machine that stores the temporary files
+        generated during simulation and measurement. The files are packed
+        into one archive, so that they are uploaded in a single transfer.
+
+        Arguments:
+            locations:
+                List of locations of files on the local machine.
+        """
+        archiveFileHandler = NamedTemporaryFile(prefix=config.TEMP_CASE,
+                                                suffix="-gt.tar",
+                                                dir=self._measurementDir,
+                                                delete=False)
+        with archiveFileHandler:
+            with tarfile.open(fileobj=archiveFileHandler,
+                              mode="w") as archive:
+                for location in locations:
+                    archive.add(location, arcname=os.path.basename(location))
+        archiveLocation = archiveFileHandler.name
+        self._transferFile(archiveLocation)
+
+        remoteArchiveLocation = self._getRemotePath(archiveLocation)
+        if run("tar -xf %s -C %s && rm -f %s" %
+               (remoteArchiveLocation, self._remoteMeasurementDir,
+                remoteArchiveLocation)).failed:
+            errMsg = ("Error in unpacking the files uploaded to "
+                      "the remote computer.")
             raise GameTimeError(errMsg)
 
     def _createTestCaseFile(self, path, addFunctionCall=True):
@@ -85,19 +120,7 @@ class SimItArmSimulator(Simulator):
             Location of the temporary C file that contains the test case.
         """
         projectConfig = self.projectConfig
-
-        contents = []
-        contents.append("#include \"%s\"" % projectConfig.nameOrigFile)
-        contents.append("")
-        contents.append("int %s(void)" % config.ANNOTATION_SIMULATE)
-        contents.append("{")
-        for key in sorted(path.assignments.keys()):
-            contents.append("  %s = %s;" % (key, path.assignments[key]))
-        if addFunctionCall:
-            contents.append("  %s();" % projectConfig.func)
-        contents.append("  return 0;")
-        contents.append("}")
-        contents.append("")
+        assignments = path.assignments
 
         tempFilePrefix = "%s%s-" % (config.TEMP_CASE,
                                     ("" if addFunctionCall else "-0"))
@@ -106,7 +129,14 @@ class SimItArmSimulator(Simulator):
                                                  dir=self._measurementDir,
                                                  delete=False)
         with testCaseFileHandler:
-            testCaseFileHandler.write("\n".join(contents))
+            write = testCaseFileHandler.write
+            write("#include \"%s\"\n\nint %s(void)\n{\n" %
+                  (projectConfig.nameOrigFile, config.ANNOTATION_SIMULATE))
+            write("".join(["  %s = %s;\n" % (key, assignments[key])
+                           for key in sorted(assignments)]))
+            if addFunctionCall:
+                write("  %s();\n" % projectConfig.func)
+            write("  return 0;\n}\n")
         return testCaseFileHandler.name
 
     def _createZeroTestCaseFile(self, path):
@@ -148,6 +178,33 @@ class SimItArmSimulator(Simulator):
         Returns:
             Cycle count of the path, as measured on the SimIt-ARM simulator.
         """
+        return self.measurePaths([path])[0]
+
+    def measurePaths(self, paths, numWorkers=1):
+        """
+        Stages the test cases of all of the paths provided on the remote
+        machine at once: the remote temporary directory is created once,
+        the test cases are uploaded in a single archive, and the directory
+        is removed once all of the paths have been measured.
+
+        Arguments:
+            paths:
+                List of paths whose cycle counts need to be measured, each
+                represented by a :class:`~gametime.path.Path` object.
+            numWorkers:
+                Ignored, since the test cases of all of the paths are
+                already uploaded together. A warning is logged if more
+                than one worker is requested.
+
+        Returns:
+            List of the cycle counts of the paths in the list provided,
+            as measured on the SimIt-ARM simulator.
+        """
+        if numWorkers > 1:
+            logger.warning("The SimIt-ARM simulator does not measure "
+                           "paths in parallel: ignoring the request for "
+                           "%d workers." % numWorkers)
+
         # Create the temporary directory where the temporary files generated
         # during measurement will be stored.
         createDir(self._measurementDir)
@@ -158,10 +215,18 @@ class SimItArmSimulator(Simulator):
                           "for measurements on the remote computer.")
                 raise GameTimeError(errMsg)
 
-            testCaseFileLocation = self._createTestCaseFile(path)
-            self._transferFile(testCaseFileLocation)
-            zeroTestCaseFileLocation = self._createZeroTestCaseFile(path)
-            self._transferFile(zeroTestCaseFileLocation)
+            testCaseFileLocations = []
+            for path in paths:
+                testCaseFileLocations.append(self._createTestCaseFile(path))
+                testCaseFileLocations.append(
+                    self._createZeroTestCaseFile(path)
+                )
+            self._transferFiles(testCaseFileLocations)
+
+            # TODO (jokotker): Not completely integrated.
+            measurements = [0] * len(paths)
+            for path, measurement in zip(paths, measurements):
+                path.measuredValue = measurement
 
             if run("rm -rf %s" % self._remoteMeasurementDir):
                 errMsg = ("Error in removing the temporary directory "
@@ -172,8 +237,7 @@ class SimItArmSimulator(Simulator):
                       "when simulated on the SimIt-ARM simulator: %s" % e)
             raise GameTimeError(errMsg)
 
-        # TODO (jokotker): Not completely integrated.
-        return 0
+        return measurements
 
 
 if __name__ == "__main__":
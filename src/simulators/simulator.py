@@ -13,11 +13,34 @@ for details on the GameTime license and authors.
 
 
 import os
+from multiprocessing import Pool
 
 from gametime.defaults import config, logger
 from gametime.gametimeError import GameTimeError
 
 
+def _measureInWorker(simulatorAndPath):
+    """Measures the value of a path in a worker process. This function
+    is defined at module level so that it can be sent to worker processes.
+
+    Arguments:
+        simulatorAndPath:
+            Tuple whose first element is a :class:`Simulator` object, and
+            whose second element is the :class:`~gametime.path.Path` object
+            that represents the path whose value needs to be measured.
+
+    Returns:
+        Value of the path, as measured on the simulator.
+    """
+    simulator, path = simulatorAndPath
+    # Each worker process receives its own copy of the simulator. Give
+    # this copy its own temporary directory, so that measurements that
+    # run concurrently do not overwrite each other's temporary files.
+    simulator._measurementDir = "%s-%d" % (simulator._measurementDir,
+                                           os.getpid())
+    return simulator.measure(path)
+
+
 class Simulator(object):
     """Maintains a representation of a simulator, which will be used
     to measure values that correspond to different paths in the code
@@ -58,24 +81,43 @@ class Simulator(object):
         """
         return 0
 
-    def measurePaths(self, paths):
+    def measurePaths(self, paths, numWorkers=1):
         """
         Arguments:
             paths:
                 List of paths whose values need to be measured, each
                 represented by a :class:`~gametime.path.Path` object.
+            numWorkers:
+                Number of processes that measure the values of the paths
+                concurrently. If this number is 1, the paths are measured
+                one after another in the current process.
 
         Returns:
             List of the values of the paths in the list provided, as
             measured on the simulator that is represented by this object.
         """
-        measurements = []
+        if numWorkers > 1 and len(paths) > 1:
+            logger.info("Measuring the values of %d paths using %d "
+                        "processes..." % (len(paths), numWorkers))
+            pool = Pool(processes=numWorkers)
+            try:
+                measurements = pool.map(_measureInWorker,
+                                        [(self, path) for path in paths])
+            finally:
+                pool.terminate()
+            for path, measurement in zip(paths, measurements):
+                path.measuredValue = measurement
+            logger.info("Values measured.")
+            logger.info("")
+            return measurements
+
+        measurements = [0] * len(paths)
         for pathNum, path in enumerate(paths):
             logger.info("Measuring the value of path %d..." % (pathNum+1))
 
             measurement = self.measure(path)
             path.measuredValue = measurement
-            measurements.append(measurement)
+            measurements[pathNum] = measurement
 
             logger.info("Value measured.")
             logger.info("")
@@ -101,14 +143,10 @@ class Simulator(object):
             raise GameTimeError(errMsg)
         else:
             with measurementsFileHandler:
-                measurements = []
-                measurementLines = measurementsFileHandler.readlines()
-                for measurementLine in measurementLines:
-                    _, measurement = measurementLine.strip().split()
-                    measurements.append(float(measurement))
-                return measurements
-
-    def writeMeasurementsToFile(self, location, paths):
+                return [float(measurementLine.split()[1])
+                        for measurementLine in measurementsFileHandler]
+
+    def writeMeasurementsToFile(self, location, paths, numWorkers=1):
         """Measures the values of the paths in the list provided, and
         records these values in the file whose location is provided.
         The format of the file is the same as that expected by
@@ -120,6 +158,10 @@ class Simulator(object):
             paths:
                 List of paths whose values need to be measured, each
                 represented by a :class:`~gametime.path.Path` object.
+            numWorkers:
+                Number of processes that measure the values of the paths
+                concurrently, as described in the documentation of
+                the :meth:`measurePaths` method.
         """
         logger.info("Measuring the values of paths on the%ssimulator..." %
                     (" " if self.name == "" else (" %s " % self.name)))
@@ -132,9 +174,10 @@ class Simulator(object):
             raise GameTimeError(errMsg)
         else:
             with measurementsFileHandler:
-                measurements = self.measurePaths(paths)
-                for pathNum, value in enumerate(measurements):
-                    measurementsFileHandler.write("%d\t%d\n" %
-                                                  ((pathNum + 1), value))
+                measurements = self.measurePaths(paths, numWorkers)
+                measurementsFileHandler.write(
+                    "".join("%d\t%d\n" % (pathNum, value) for pathNum, value
+                            in enumerate(measurements, 1))
+                )
 
             logger.info("Measurement of all path values complete.")
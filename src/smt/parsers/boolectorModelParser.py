@@ -84,7 +84,7 @@ class BoolectorModelParser(ModelParser):
 
     def p_temp_var(self, p):
         """temp_var : var_name LANGLE NUMBER RANGLE"""
-        p[0] = p[1] + p[2] + p[3] + p[4]
+        p[0] = intern(p[1] + p[2] + p[3] + p[4])
 
     def p_index_var(self, p):
         """index_var : TEMPINDEX NUMBER"""
@@ -92,7 +92,7 @@ class BoolectorModelParser(ModelParser):
 
     def p_efc_var(self, p):
         """efc_var : EFC var_name AT NUMBER"""
-        p[0] = p[1] + p[2] + p[3] + p[4]
+        p[0] = intern(p[1] + p[2] + p[3] + p[4])
 
     def p_constraint_var(self, p):
         """constraint_var : CONSTRAINT NUMBER"""
@@ -455,13 +455,43 @@ class ModelParser(object):
             logger.info("Model to parse:")
             logger.info(str(model))
 
+        self._parseModel(model, projectConfig)
+        return self._getAssignments(arrayAccesses, aggIndexExprs, projectConfig)
+
+    def _parseModel(self, model, projectConfig):
+        """Parses the model provided, and stores the information in
+        the model. By default, the string representation of the model
+        is parsed; subclasses can read the model in other ways.
+
+        Arguments:
+            model:
+                Model generated by an SMT solver in response to
+                a satisfiable query.
+            projectConfig:
+                :class:`~gametime.projectConfiguration.ProjectConfiguration`
+                object that represents the configuration of a GameTime project.
+        """
+        self._parse(str(model), projectConfig)
+
+    def _parse(self, modelStr, projectConfig):
+        """Parses the model provided, using the grammar rules of this
+        model parser, and stores the information in the model.
+
+        Arguments:
+            modelStr:
+                String representation of the model generated by
+                an SMT solver in response to a satisfiable query.
+            projectConfig:
+                :class:`~gametime.projectConfiguration.ProjectConfiguration`
+                object that represents the configuration of a GameTime project.
+        """
         if projectConfig.debugConfig.KEEP_PARSER_OUTPUT:
             self.modelLexer.build(debug=True, debuglog=logger,
                                   errorlog=logger,
                                   outputdir=projectConfig.locationTempDir)
         else:
             self.modelLexer.build(debug=False)
-        self.modelLexer.input(str(model))
+        self.modelLexer.input(modelStr)
 
         self.tokens = self.modelLexer.tokens
         if projectConfig.debugConfig.KEEP_PARSER_OUTPUT:
@@ -471,9 +501,7 @@ class ModelParser(object):
                                write_tables=0)
         else:
             parser = yacc.yacc(debug=False, module=self, write_tables=0)
-        parser.parse(str(model), lexer=self.modelLexer)
-
-        return self._getAssignments(arrayAccesses, aggIndexExprs, projectConfig)
+        parser.parse(modelStr, lexer=self.modelLexer)
 
     ### PARSER GRAMMAR RULES ###
     def p_error(self, p):
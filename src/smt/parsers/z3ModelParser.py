@@ -11,9 +11,11 @@ for details on the GameTime license and authors.
 """
 
 
+import re
+
 from gametime.defaults import config
+from gametime.gametimeError import GameTimeError
 from gametime.smt.parsers.modelParser import Mapping, ModelParser
-from gametime.smt.parsers.z3ModelLexer import Z3ModelLexer
 
 
 class Z3Function(Mapping):
@@ -40,10 +42,13 @@ class Z3Function(Mapping):
         @param projectConfig ProjectConfiguration object.
         @retval Output value that the input value is mapped to.
         """
-        return self.outputs.get(inputVal,
-                                self.defaultOutput.get(inputVal,
-                                                       projectConfig)
-                                if self.defaultOutput is not None else 0)
+        outputs = self.outputs
+        if inputVal in outputs:
+            return outputs[inputVal]
+        # The default output is only looked up when it is needed.
+        defaultOutput = self.defaultOutput
+        return (defaultOutput.get(inputVal, projectConfig)
+                if defaultOutput is not None else 0)
 
 
 class Z3ConstantFunction(Z3Function):
@@ -106,12 +111,12 @@ class Z3Array(Mapping):
         @retval Value of the array at the indices specified.
         """
         if not projectConfig.MODEL_AS_NESTED_ARRAYS:
-            indexSize = config.WORD_BITSIZE / 4
-            hexIndices = ""
+            # Concatenate the bits of the indices into a single index.
+            wordBitsize = config.WORD_BITSIZE
+            flatIndex = 0
             for index in indices:
-                hexIndex = ModelParser.decToHex(index)[2:]
-                hexIndices += hexIndex.zfill(indexSize)
-            indices = (ModelParser.hexToDec(hexIndices),)
+                flatIndex = (flatIndex << wordBitsize) | index
+            indices = (flatIndex,)
 
         z3Function = self.modelParser.allMappings[self.functionName]
         if len(indices) == 1:
@@ -125,6 +130,10 @@ class Z3ModelParser(ModelParser):
     """
     This class parses the models generated by Z3,
     the SMT solver from Microsoft.
+
+    The models are sequences of fully parenthesized `define-fun'
+    s-expressions, so they are read with a single regular expression
+    and a stack, rather than with an LALR parser.
     """
     def __init__(self):
         """
@@ -134,171 +143,265 @@ class Z3ModelParser(ModelParser):
         """
         super(Z3ModelParser, self).__init__()
 
-        # Z3ModelLexer object that performs the lexical analysis
-        # of the models generated by Z3.   
-        self.modelLexer = Z3ModelLexer()
-
-    ### PARSER GRAMMAR RULES ###
-    def p_model(self, p):
-        """model : assign
-                 | assign model"""
-        p[0] = None
-
-    def p_type_boolean(self, p):
-        """type_boolean : BOOL"""
-        p[0] = None
-
-    def p_type_bv(self, p):
-        """type_bv : LPAREN WORD BITVEC NUMBER RPAREN"""
-        p[0] = None
-
-    def p_type_array(self, p):
-        """type_array : LPAREN ARRAY type_bv type_bv RPAREN
-                      | LPAREN ARRAY type_bv type_array RPAREN"""
-        p[0] = None
-
-    def p_var_name(self, p):
-        """var_name : WORD"""
-        p[0] = p[1]
-
-    # Grammar rule for variables whose name is a special token.
-    def p_var_name_special(self, p):
-        """var_name : BOOL
-                    | BITVEC
-                    | ARRAY
-                    | BOOL var_name
-                    | BITVEC var_name
-                    | ARRAY var_name
-                    | WORD var_name"""
-        p[0] = p[1]
-
-    def p_temp_var(self, p):
-        """temp_var : var_name LANGLE NUMBER RANGLE"""
-        p[0] = p[1] + p[2] + str(p[3]) + p[4]
-
-    def p_index_var(self, p):
-        """index_var : TEMPINDEX NUMBER"""
-        p[0] = p[2]
-
-    def p_temp_z3_var(self, p):
-        """temp_z3_var : WORD BANG NUMBER"""
-        p[0] = p[1] + p[2] + str(p[3])
-
-    def p_efc_var(self, p):
-        """efc_var : EFC var_name AT NUMBER"""
-        p[0] = p[1] + p[2] + p[3] + str(p[4])
-
-    def p_constraint_var(self, p):
-        """constraint_var : CONSTRAINT NUMBER"""
-        p[0] = None
-
-    def p_func_no_args(self, p):
-        """func_no_args : LPAREN RPAREN"""
-        p[0] = None
-
-    def p_func_bv_arg(self, p):
-        """func_bv_arg : LPAREN LPAREN temp_z3_var type_bv RPAREN RPAREN"""
-        p[0] = None
-
-    def p_define_var(self, p):
-        """define_var : DEFINEFUN var_name func_no_args type_bv"""
-        p[0] = p[2]
-
-    def p_define_temp_var(self, p):
-        """define_temp_var : DEFINEFUN temp_var func_no_args type_bv"""
-        p[0] = p[2]
-
-    def p_define_index_var(self, p):
-        """define_index_var : DEFINEFUN index_var func_no_args type_bv"""
-        p[0] = p[2]
-
-    def p_define_array_var(self, p):
-        """define_array_var : DEFINEFUN var_name func_no_args type_array
-                            | DEFINEFUN temp_var func_no_args type_array"""
-        p[0] = p[2]
-
-    def p_define_z3_func_var(self, p):
-        """define_z3_func_var : DEFINEFUN temp_z3_var func_bv_arg type_bv
-                              | DEFINEFUN temp_z3_var func_bv_arg type_array"""
-        p[0] = p[2]
-
-    def p_define_efc_var(self, p):
-        """define_efc_var : DEFINEFUN efc_var func_no_args type_bv"""
-        p[0] = p[2]
-
-    def p_define_constraint_var(self, p):
-        """define_constraint_var : DEFINEFUN constraint_var func_no_args \
-                                   type_boolean"""
-        p[0] = p[2]
-
-    def p_assign_var(self, p):
-        """assign : LPAREN define_var HEXNUMBER RPAREN
-                  | LPAREN define_var BINNUMBER RPAREN"""
-        self.allAssignments[p[2]] = p[3]
-        p[0] = None
-
-    def p_assign_temp_var(self, p):
-        """assign : LPAREN define_temp_var HEXNUMBER RPAREN
-                  | LPAREN define_temp_var BINNUMBER RPAREN"""
-        self.allAssignments[p[2]] = p[3]
-        p[0] = None
-
-    def p_assign_index_var(self, p):
-        """assign : LPAREN define_index_var HEXNUMBER RPAREN"""
-        self.arrayTempIndexVals[p[2]] = p[3]
-        p[0] = None
-
-    def p_z3_func_as_array(self, p):
-        """z3_func_as_array : LPAREN WORD ASARRAY temp_z3_var RPAREN"""
-        p[0] = Z3Array(self, functionName=p[4])
-
-    def p_assign_array_var(self, p):
-        """assign : LPAREN define_array_var z3_func_as_array RPAREN"""
-        p[3].name = p[2]
-        self.allMappings[p[2]] = p[3]
-        p[0] = None
-
-    def p_assign_z3_const_func_var(self, p):
-        """assign : LPAREN define_z3_func_var HEXNUMBER RPAREN
-                  | LPAREN define_z3_func_var BINNUMBER RPAREN
-                  | LPAREN define_z3_func_var z3_func_as_array RPAREN"""
-        self.allMappings[p[2]] = Z3ConstantFunction(self, p[2], p[3])
-        p[0] = None
-
-    def p_assign_z3_func_var(self, p):
-        """assign : LPAREN define_z3_func_var func_ite RPAREN"""
-        p[3].name = p[2]
-        self.allMappings[p[2]] = p[3]
-        p[0] = None
-
-    def p_func_ite_condition(self, p):
-        """ite_condition : LPAREN EQUALS temp_z3_var HEXNUMBER RPAREN"""
-        p[0] = p[4]
-
-    def p_func_ite_else(self, p):
-        """func_ite : LPAREN WORD ite_condition HEXNUMBER HEXNUMBER RPAREN
-                    | LPAREN WORD ite_condition BINNUMBER BINNUMBER RPAREN
-                    | LPAREN WORD ite_condition z3_func_as_array \
-                      z3_func_as_array RPAREN"""
-        z3ConstantFunction = Z3ConstantFunction(self, defaultOutput=p[5])
-        z3Function = Z3Function(self, defaultOutput=z3ConstantFunction)
-        z3Function.add(p[3], p[4])
-        p[0] = z3Function
-
-    def p_func_ite(self, p):
-        """func_ite : LPAREN WORD ite_condition HEXNUMBER func_ite RPAREN
-                    | LPAREN WORD ite_condition BINNUMBER func_ite RPAREN
-                    | LPAREN WORD ite_condition z3_func_as_array \
-                      func_ite RPAREN"""
-        p[5].add(p[3], p[4])
-        p[0] = p[5]
-
-    def p_assign_efc_var(self, p):
-        """assign : LPAREN define_efc_var HEXNUMBER RPAREN
-                  | LPAREN define_efc_var BINNUMBER RPAREN"""
-        self.allAssignments[p[2]] = p[3]
-        p[0] = None
-
-    def p_assign_constraint_var(self, p):
-        """assign : LPAREN define_constraint_var TRUE RPAREN"""
-        p[0] = None
+    def _parse(self, modelStr, projectConfig):
+        """
+        Parses the model provided, and stores the assignments,
+        the mappings and the values of the temporary array indices
+        that the model defines.
+
+        @param modelStr String representation of the model generated
+        by Z3 in response to a satisfiable query.
+        @param projectConfig ProjectConfiguration object.
+        """
+        for definition in _readSExpressions(modelStr):
+            self._parseDefinition(definition)
+
+    def _parseModel(self, model, projectConfig):
+        """
+        Parses the model provided, and stores the assignments,
+        the mappings and the values of the temporary array indices
+        that the model defines. If the model object of the Z3 Python API
+        is available, it is read directly, instead of being converted to
+        a string that is then parsed.
+
+        @param model Model generated by Z3 in response to
+        a satisfiable query.
+        @param projectConfig ProjectConfiguration object.
+        """
+        z3Model = getattr(model, "z3Model", None)
+        if z3Model is None:
+            super(Z3ModelParser, self)._parseModel(model, projectConfig)
+            return
+
+        # The model object can only have been created if Z3 is available.
+        import z3
+        for decl in z3Model.decls():
+            name = intern(str(decl.name()))
+            if self._isConstraintVar(name):
+                # The Boolean variables associated with constraints
+                # are not assigned to.
+                continue
+            elif decl.arity():
+                self.allMappings[name] = self._readFunction(
+                    name, decl, z3Model.get_interp(decl)
+                )
+            elif decl.range().kind() == z3.Z3_ARRAY_SORT:
+                # Read the array through the C API, since the Python API
+                # replaces an `as-array' value with its interpretation.
+                ctxRef = z3Model.ctx.ref()
+                value = z3.Z3_model_get_const_interp(ctxRef, z3Model.model,
+                                                     decl.ast)
+                if not z3.Z3_is_as_array(ctxRef, value):
+                    _raiseSyntaxError(name)
+                funcDecl = z3.Z3_get_as_array_func_decl(ctxRef, value)
+                funcName = z3.Z3_get_symbol_string(
+                    ctxRef, z3.Z3_get_decl_name(ctxRef, funcDecl)
+                )
+                z3Array = Z3Array(self, functionName=intern(funcName))
+                z3Array.name = name
+                self.allMappings[name] = z3Array
+            elif self._isIndexVar(name):
+                indexVarNumber = self._getIndexVarNumber(name)
+                self.arrayTempIndexVals[indexVarNumber] = \
+                    _readNumber(z3Model.get_interp(decl))
+            else:
+                self.allAssignments[name] = \
+                    _readNumber(z3Model.get_interp(decl))
+
+    def _readFunction(self, name, decl, funcInterp):
+        """
+        Reads the interpretation of a Z3 function of one argument
+        from the model object of the Z3 Python API.
+
+        @param name Name of the function.
+        @param decl Declaration of the function, as a Z3 Python API object.
+        @param funcInterp Interpretation of the function, as a Z3 Python
+        API object.
+        @retval Z3Function object that represents the function.
+        """
+        if decl.arity() != 1:
+            _raiseSyntaxError(name)
+
+        defaultOutput = funcInterp.else_value()
+        defaultOutput = (0 if defaultOutput is None else
+                         self._readValue(defaultOutput))
+        defaultFunction = Z3ConstantFunction(self, defaultOutput=defaultOutput)
+        z3Function = Z3Function(self, name, defaultFunction)
+        for entryIndex in xrange(funcInterp.num_entries()):
+            entry = funcInterp.entry(entryIndex)
+            z3Function.add(_readNumber(entry.arg_value(0)),
+                           self._readValue(entry.value()))
+        return z3Function
+
+    def _readValue(self, value):
+        """
+        Reads the value of a Z3 function or array variable from
+        the model object of the Z3 Python API.
+
+        @param value Value, as a Z3 Python API expression that is either
+        a bit-vector numeral or an `as-array' expression.
+        @retval Number represented by the numeral, or the Z3Array object
+        described by the `as-array' expression.
+        """
+        import z3
+        if z3.is_as_array(value):
+            funcName = str(z3.get_as_array_func(value).name())
+            return Z3Array(self, functionName=intern(funcName))
+        return _readNumber(value)
+
+    def _parseDefinition(self, definition):
+        """
+        Parses a `define-fun' s-expression in a model, and stores
+        the information that it defines.
+
+        @param definition `define-fun' s-expression, as a nested list
+        of strings.
+        """
+        if (not isinstance(definition, list) or len(definition) != 5 or
+            definition[0] != "define-fun"):
+            _raiseSyntaxError(definition)
+        _, name, args, _, value = definition
+
+        if self._isConstraintVar(name):
+            # The Boolean variables associated with constraints
+            # are not assigned to.
+            return
+        elif args:
+            self.allMappings[name] = self._parseFunction(name, value)
+        elif isinstance(value, list):
+            z3Array = self._parseValue(value)
+            z3Array.name = name
+            self.allMappings[name] = z3Array
+        elif self._isIndexVar(name):
+            indexVarNumber = self._getIndexVarNumber(name)
+            self.arrayTempIndexVals[indexVarNumber] = _parseNumber(value)
+        else:
+            self.allAssignments[name] = _parseNumber(value)
+
+    def _parseValue(self, value):
+        """
+        Parses the value of a Z3 function or array variable.
+
+        @param value Value, either as a numeral or as an `as-array'
+        s-expression.
+        @retval Number represented by the numeral, or the Z3Array object
+        described by the `as-array' s-expression.
+        """
+        if isinstance(value, list):
+            if len(value) != 3 or value[:2] != ["_", "as-array"]:
+                _raiseSyntaxError(value)
+            return Z3Array(self, functionName=value[2])
+        return _parseNumber(value)
+
+    def _parseFunction(self, name, value):
+        """
+        Parses the definition of a Z3 function of one argument.
+
+        @param name Name of the function.
+        @param value Body of the function, either as a value or as
+        a chain of `ite' s-expressions that compare the argument
+        of the function with numerals.
+        @retval Z3Function object that represents the function.
+        """
+        if not _isIte(value):
+            return Z3ConstantFunction(self, name, self._parseValue(value))
+
+        branches = []
+        while _isIte(value):
+            if len(value) != 4:
+                _raiseSyntaxError(value)
+            _, condition, output, value = value
+            if (not isinstance(condition, list) or len(condition) != 3 or
+                condition[0] != "="):
+                _raiseSyntaxError(condition)
+            branches.append((_parseNumber(condition[2]),
+                             self._parseValue(output)))
+
+        defaultOutput = self._parseValue(value)
+        defaultFunction = Z3ConstantFunction(self, defaultOutput=defaultOutput)
+        z3Function = Z3Function(self, name, defaultFunction)
+        # Add the innermost branches first, so that an outer branch
+        # takes precedence over an inner branch for the same input.
+        for inputVal, outputVal in reversed(branches):
+            z3Function.add(inputVal, outputVal)
+        return z3Function
+
+
+#: Regular expression that matches the tokens in a model generated by Z3:
+#: parentheses, symbols quoted with vertical bars, and other atoms.
+_tokenRegex = re.compile(r"\(|\)|\|[^|]*\||[^\s()|]+")
+
+
+def _readSExpressions(modelStr):
+    """
+    Reads the top-level s-expressions in the string provided.
+
+    @param modelStr String that contains s-expressions.
+    @retval List of the top-level s-expressions in the string, each
+    represented as a nested list of atoms. Symbols quoted with vertical
+    bars are returned without the bars. The atoms are interned, since
+    the same names recur throughout a model and are used as dictionary
+    keys.
+    """
+    current = []
+    stack = []
+    for match in _tokenRegex.finditer(modelStr):
+        token = match.group()
+        if token == "(":
+            stack.append(current)
+            current = []
+        elif token == ")":
+            if not stack:
+                _raiseSyntaxError(token)
+            sExpression = current
+            current = stack.pop()
+            current.append(sExpression)
+        elif token[0] == "|":
+            current.append(intern(token[1:-1]))
+        else:
+            current.append(intern(token))
+    if stack:
+        errMsg = "Unexpected end of input: unbalanced parentheses."
+        raise GameTimeError(errMsg)
+    return current
+
+
+def _isIte(value):
+    """
+    @param value Atom or s-expression.
+    @retval True if, and only if, the value is an `ite' s-expression.
+    """
+    return isinstance(value, list) and len(value) > 0 and value[0] == "ite"
+
+
+def _parseNumber(numeral):
+    """
+    @param numeral Hexadecimal (`#x') or binary (`#b') numeral.
+    @retval Number represented by the numeral.
+    """
+    if not isinstance(numeral, list):
+        if numeral.startswith("#x"):
+            return ModelParser.hexToDec(numeral[2:])
+        elif numeral.startswith("#b"):
+            return ModelParser.binToDec(numeral[2:])
+    _raiseSyntaxError(numeral)
+
+
+def _readNumber(value):
+    """
+    @param value Bit-vector numeral, as a Z3 Python API expression.
+    @retval Number represented by the numeral.
+    """
+    if value is None or not hasattr(value, "as_long"):
+        _raiseSyntaxError(value)
+    return value.as_long()
+
+
+def _raiseSyntaxError(value):
+    """
+    Raises the error for a syntax error in a model.
+
+    @param value Part of the model where the syntax error was found.
+    """
+    errMsg = "Syntax error in input: '%s' " % value
+    raise GameTimeError(errMsg)
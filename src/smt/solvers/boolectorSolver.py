@@ -11,15 +11,29 @@ for details on the GameTime license and authors.
 """
 
 
+import hashlib
+import re
 import subprocess
-from tempfile import NamedTemporaryFile
+from collections import OrderedDict
+from Queue import Queue
+from threading import Thread, Timer
 
 from gametime.defaults import config
 from gametime.gametimeError import GameTimeError
 from gametime.smt.model import Model
+from gametime.smt.query import Satisfiability
 from gametime.smt.solvers.solver import Solver
 
 
+#: Maximum number of results of earlier queries that a BoolectorSolver
+#: object keeps, so that an identical query is not solved again.
+QUERY_CACHE_SIZE = 4096
+
+#: Number of seconds that a Boolector process is given, beyond its own
+#: time limit, to report its result before it is killed.
+TIMEOUT_GRACE_PERIOD = 2
+
+
 class SatSolver(object):
     """This class represents the SAT solver used by Boolector."""
     # Lingeling SAT solver (default).
@@ -28,6 +42,9 @@ class SatSolver(object):
     MINISAT = 1
     # PicoSAT SAT solver.
     PICOSAT = 2
+    # Portfolio of all of the SAT solvers above, which are raced
+    # against each other on each query.
+    PORTFOLIO = 3
 
     @staticmethod
     def getSatSolver(satSolverName):
@@ -39,14 +56,9 @@ class SatSolver(object):
         @retval SatSolver representation of the SAT solver
         whose name is provided.
         """
-        satSolverName = satSolverName.lower()
-        if satSolverName == "lingeling" or satSolverName == "":
-            return SatSolver.LINGELING
-        elif satSolverName == "minisat":
-            return SatSolver.MINISAT
-        elif satSolverName == "picosat":
-            return SatSolver.PICOSAT
-        else:
+        try:
+            return _satSolvers[satSolverName.lower()]
+        except KeyError:
             errMsg = ("Unknown backend SAT solver for Boolector: %s" %
                       satSolverName)
             raise GameTimeError(errMsg)
@@ -61,26 +73,143 @@ class SatSolver(object):
         @retval Name of the SAT solver whose SatSolver representation
         is provided.
         """
-        if satSolver == SatSolver.LINGELING:
-            return "lingeling"
-        elif satSolver == SatSolver.MINISAT:
-            return "minisat"
-        elif satSolver == SatSolver.PICOSAT:
-            return "picosat"
-        else:
+        try:
+            return _satSolverNames[satSolver]
+        except KeyError:
             errMsg = ("Unknown backend SAT solver for Boolector: %s" %
                       satSolver)
             raise GameTimeError(errMsg)
 
 
+#: Dictionary that maps the SatSolver representation of a SAT solver
+#: to the name of the SAT solver.
+_satSolverNames = {
+    SatSolver.LINGELING: "lingeling",
+    SatSolver.MINISAT: "minisat",
+    SatSolver.PICOSAT: "picosat",
+    SatSolver.PORTFOLIO: "portfolio"
+}
+
+#: Dictionary that maps the lowercase name of a SAT solver to
+#: the SatSolver representation of the SAT solver. Lingeling is
+#: the SAT solver if no name is provided.
+_satSolvers = dict((name, satSolver) for satSolver, name
+                   in _satSolverNames.iteritems())
+_satSolvers[""] = SatSolver.LINGELING
+
+
+#: Regular expression that matches the line of the output of Boolector
+#: that contains its verdict, including the newline that ends the line.
+_verdictRegex = re.compile(r"^(?P<verdict>sat|unsat|unknown)[ \t\r]*(?:\n|$)",
+                           re.MULTILINE)
+
+#: Regular expression that matches the tokens in an SMT-LIB query:
+#: parentheses, symbols quoted with vertical bars, string literals
+#: and other atoms. Comments are matched separately, so that they
+#: can be dropped.
+_queryTokenRegex = re.compile(r'(;[^\n]*)|'
+                              r'(\(|\)|\|[^|]*\||"[^"]*"|[^\s()|";]+)')
+
+#: Commands of the SMT-LIB language whose first argument is the name of
+#: a symbol that the command declares.
+_declarationCommands = frozenset(["declare-fun", "declare-const",
+                                  "define-fun"])
+
+#: Regular expression that matches the name at the start of each line of
+#: a model generated by Boolector, which precedes either an index into
+#: an array or the value that is assigned to the name.
+_modelNameRegex = re.compile(r"^[^\s\[]+", re.MULTILINE)
+
+
+def _canonicalize(queryStr):
+    """
+    Canonicalizes an SMT query, so that queries that differ only in
+    their comments, their whitespace or the names of the symbols that
+    they declare have the same canonical form. The declared symbols are
+    renamed in the order in which they are declared.
+
+    @param queryStr String that contains an SMT query.
+    @retval Tuple of the canonical form of the SMT query and the list of
+    the names of the declared symbols, in the order in which they are
+    declared.
+    """
+    tokens = [match.group(2) for match in _queryTokenRegex.finditer(queryStr)
+              if match.group(2) is not None]
+
+    names = []
+    canonicalNames = {}
+    for tokenIndex in xrange(1, len(tokens) - 1):
+        if (tokens[tokenIndex] in _declarationCommands and
+            tokens[tokenIndex-1] == "("):
+            name = tokens[tokenIndex+1]
+            if name not in canonicalNames:
+                canonicalNames[name] = _canonicalName(len(names))
+                names.append(name)
+
+    canonicalTokens = [canonicalNames.get(token, token) for token in tokens]
+    return " ".join(canonicalTokens), names
+
+
+def _canonicalName(index):
+    """
+    @param index Position of a symbol among the symbols that an SMT query
+    declares.
+    @retval Canonical name of the symbol.
+    """
+    return "|%d|" % index
+
+
+def _unquote(name):
+    """
+    @param name Name of a symbol.
+    @retval Name of the symbol without the vertical bars that quote it,
+    if any, as it appears in a model generated by Boolector.
+    """
+    if len(name) > 1 and name[0] == "|" and name[-1] == "|":
+        return name[1:-1]
+    return name
+
+
+def _renameModel(modelStr, newNames):
+    """
+    Renames the symbols in a model generated by Boolector.
+
+    @param modelStr String representation of the model.
+    @param newNames Dictionary that maps the names of symbols in the model
+    to their new names. Symbols whose names are not in the dictionary
+    are not renamed.
+    @retval String representation of the renamed model.
+    """
+    return _modelNameRegex.sub(
+        lambda match: newNames.get(match.group(), match.group()), modelStr
+    )
+
+
+def _killProcess(proc):
+    """
+    Kills the process provided, if it is still running.
+
+    @param proc Popen object that represents the process.
+    """
+    if proc.poll() is None:
+        try:
+            proc.kill()
+        except OSError:
+            # The process exited after it was polled.
+            pass
+
+
 class BoolectorSolver(Solver):
     """This class maintains a representation of the Boolector SMT solver."""
-    def __init__(self, satSolver=SatSolver.LINGELING):
+    def __init__(self, satSolver=SatSolver.LINGELING, timeout=None):
         """
         Constructor for the BoolectorSolver class.
 
         @param satSolver SatSolver representation of the SAT solver that
         the Boolector executable uses.
+        @param timeout Number of seconds after which the satisfiability
+        of a query is considered unknown, or None if the satisfiability
+        of a query is checked without a time limit.
         """
         super(BoolectorSolver, self).__init__("boolector")
 
@@ -88,12 +217,47 @@ class BoolectorSolver(Solver):
         # the Boolector executable uses.
         self.satSolver = satSolver
 
-    def _generateBoolectorCommand(self, location):
+        # Number of seconds after which the satisfiability of a query
+        # is considered unknown, if any.
+        self.timeout = timeout
+
+        self._initDerivedState()
+
+    def _initDerivedState(self):
+        """
+        Initializes the state of this BoolectorSolver object that is
+        derived from its SAT solver and its timeout, and that is not
+        pickled: the system calls to run Boolector, the string
+        representation and the cache of query results.
+        """
+        satSolver = self.satSolver
+
+        # System calls to run Boolector, which do not change from one
+        # query to the next: one for each backend SAT solver that
+        # is raced, if the SAT solver is a portfolio, or else only one.
+        satSolvers = ([SatSolver.LINGELING, SatSolver.MINISAT,
+                       SatSolver.PICOSAT]
+                      if satSolver == SatSolver.PORTFOLIO else [satSolver])
+        self._boolectorCommands = [self._generateBoolectorCommand(backend)
+                                   for backend in satSolvers]
+
+        # String representation of this BoolectorSolver object,
+        # which does not change.
+        self._str = "%s-%s" % (self.name, SatSolver.getName(satSolver))
+
+        # Dictionary that maps the digest of an SMT query to its
+        # satisfiability and, if the query is satisfiable, the string
+        # representation of its model, in the order in which the queries
+        # were solved.
+        self._queryCache = OrderedDict()
+
+    def _generateBoolectorCommand(self, satSolver):
         """
-        Generates the system call to run Boolector on a file containing
-        an SMT query whose location is provided.
+        Generates the system call to run Boolector on an SMT query
+        that is read from its standard input.
 
-        @param location Location of a file containing an SMT query.
+        @param satSolver SatSolver representation of the SAT solver that
+        the Boolector executable should use.
         @retval Appropriate system call as a list that contains the program
         to be run and the proper arguments.
         """
@@ -102,8 +266,9 @@ class BoolectorSolver(Solver):
         command.append(config.SOLVER_BOOLECTOR)
         command.append("--model")
         command.append("--smt2")
-        command.append("-" + SatSolver.getName(self.satSolver))
-        command.append(location)
+        command.append("-" + SatSolver.getName(satSolver))
+        if self.timeout is not None:
+            command.append("--time=%d" % self.timeout)
 
         return command
 
@@ -117,28 +282,172 @@ class BoolectorSolver(Solver):
 
         @param query Query object that represents an SMT query.
         """
-        # Write the SMT query to a temporary file.
-        smtQueryFileHandler = NamedTemporaryFile()
-        with smtQueryFileHandler:
-            smtQueryFileHandler.write(query.queryStr)
-            smtQueryFileHandler.seek(0)
-
-            command = self._generateBoolectorCommand(smtQueryFileHandler.name)
-            proc = subprocess.Popen(command,
-                                    stdout=subprocess.PIPE,
-                                    stderr=subprocess.PIPE,
-                                    shell=True)
-            output = proc.communicate()[0]
-            outputLines = output.strip().split("\n")
-
-            isSat = outputLines.index("sat") if "sat" in outputLines else None
-            isUnsat = "unsat" in outputLines
-            if isSat is not None:
-                query.labelSat(Model("\n".join(outputLines[isSat+1:])))
-            elif isUnsat:
-                query.labelUnsat([])
+        # Queries that are identical up to the names of their symbols
+        # share an entry in the cache, whose model uses canonical names.
+        canonicalQueryStr, names = _canonicalize(query.queryStr)
+        queryDigest = hashlib.sha1(canonicalQueryStr).digest()
+        cachedResult = self._queryCache.get(queryDigest)
+        if cachedResult is not None:
+            satisfiability, modelStr = cachedResult
+            if satisfiability == Satisfiability.SAT:
+                modelStr = _renameModel(modelStr, dict(
+                    (_canonicalName(index), _unquote(name))
+                    for index, name in enumerate(names)
+                ))
+                query.labelSat(Model(modelStr))
             else:
-                query.labelUnknown()
+                query.labelUnsat([])
+            return
+
+        if len(self._boolectorCommands) == 1:
+            proc = self._startBoolector(self._boolectorCommands[0])
+            verdict, modelStr = self._readVerdict(proc, query.queryStr)
+        else:
+            verdict, modelStr = self._racePortfolio(query.queryStr)
+
+        if verdict == "sat":
+            query.labelSat(Model(modelStr))
+            canonicalModelStr = _renameModel(modelStr, dict(
+                (_unquote(name), _canonicalName(index))
+                for index, name in enumerate(names)
+            ))
+            self._cacheResult(queryDigest, Satisfiability.SAT,
+                              canonicalModelStr)
+        elif verdict == "unsat":
+            query.labelUnsat([])
+            self._cacheResult(queryDigest, Satisfiability.UNSAT, None)
+        else:
+            # Unknown results are not cached, since they may be due to
+            # a failure of this particular run of Boolector.
+            query.labelUnknown()
+
+    def _startBoolector(self, command):
+        """
+        Starts running Boolector on an SMT query that is then piped to
+        its standard input, instead of being written to a temporary file
+        that Boolector reads back.
+
+        @param command System call to run Boolector, as a list that
+        contains the program to be run and the proper arguments.
+        @retval Popen object that represents the Boolector process.
+        """
+        return subprocess.Popen(command,
+                                stdin=subprocess.PIPE,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE)
+
+    def _readVerdict(self, proc, queryStr):
+        """
+        Pipes an SMT query to a Boolector process, and reads its verdict.
+
+        @param proc Popen object that represents the Boolector process.
+        @param queryStr String that contains the SMT query.
+        @retval Tuple of the verdict of Boolector, which is `sat', `unsat'
+        or another string if the satisfiability is unknown, and
+        the string representation of the model, if the query is
+        satisfiable.
+        """
+        if self.timeout is None:
+            output = proc.communicate(queryStr)[0]
+        else:
+            # Boolector enforces its own time limit, but the process
+            # is killed if it does not exit soon after the limit.
+            killTimer = Timer(self.timeout + TIMEOUT_GRACE_PERIOD,
+                              _killProcess, (proc,))
+            killTimer.start()
+            try:
+                output = proc.communicate(queryStr)[0]
+            finally:
+                killTimer.cancel()
+
+        # Boolector prints its verdict on a line of its own, followed by
+        # the model, if the query is satisfiable. The model is not
+        # stripped, which would copy it again, since the model parser
+        # ignores the trailing whitespace.
+        match = _verdictRegex.search(output)
+        if match is None:
+            return "", ""
+        return match.group("verdict"), output[match.end():]
+
+    def _racePortfolio(self, queryStr):
+        """
+        Runs Boolector with each of its backend SAT solvers concurrently
+        on an SMT query, and reads the first decisive verdict. The other
+        Boolector processes are then killed.
+
+        @param queryStr String that contains the SMT query.
+        @retval Tuple of the first decisive verdict of Boolector, or
+        the last verdict if no verdict is decisive, and the string
+        representation of the model, as returned by `_readVerdict'.
+        """
+        results = Queue()
+
+        def readVerdict(proc):
+            result = ("", "")
+            try:
+                result = self._readVerdict(proc, queryStr)
+            finally:
+                results.put(result)
+
+        # All of the processes are started before any verdict is read,
+        # so that every loser can be killed once a winner is found.
+        procs = [self._startBoolector(command)
+                 for command in self._boolectorCommands]
+        threads = [Thread(target=readVerdict, args=(proc,))
+                   for proc in procs]
+        try:
+            for thread in threads:
+                thread.start()
+            for _ in threads:
+                verdict, modelStr = results.get()
+                if verdict in ("sat", "unsat"):
+                    break
+        finally:
+            for proc in procs:
+                _killProcess(proc)
+            for thread in threads:
+                if thread.is_alive():
+                    thread.join()
+        return verdict, modelStr
+
+    def _cacheResult(self, queryDigest, satisfiability, modelStr):
+        """
+        Stores the result of an SMT query, discarding the oldest result
+        if the cache is full.
+
+        @param queryDigest Digest of the SMT query.
+        @param satisfiability Satisfiability of the SMT query.
+        @param modelStr String representation of the model of the SMT
+        query, if the query is satisfiable.
+        """
+        queryCache = self._queryCache
+        queryCache[queryDigest] = (satisfiability, modelStr)
+        if len(queryCache) > QUERY_CACHE_SIZE:
+            queryCache.popitem(last=False)
+
+    def __getstate__(self):
+        """
+        Returns the pickled representation of a BoolectorSolver object.
+
+        @retval Pickled representation of a BoolectorSolver object.
+        """
+        objectDict = self.__dict__.copy()
+        for derivedAttr in ("_boolectorCommands", "_str", "_queryCache"):
+            objectDict.pop(derivedAttr, None)
+        return objectDict
+
+    def __setstate__(self, pickled):
+        """
+        Unpickles the provided pickled representation of
+        a BoolectorSolver object.
+
+        @param pickled Pickled representation of a BoolectorSolver object.
+        """
+        self.__dict__.update(pickled)
+        # BoolectorSolver objects pickled before timeouts were supported
+        # have no timeout.
+        self.__dict__.setdefault("timeout", None)
+        self._initDerivedState()
 
     def __str__(self):
         """
@@ -146,4 +455,4 @@ class BoolectorSolver(Solver):
 
         @retval String representation of this BoolectorSolver object.
         """
-        return self.name + "-" + SatSolver.getName(self.satSolver)
+        return self._str
@@ -19,6 +19,48 @@ from gametime.smt.model import Model
 from gametime.smt.solvers.solver import Solver
 
 
+class Z3Model(Model):
+    """
+    This class maintains a representation of a model produced by Z3
+    in response to a satisfiable SMT query. The model object of the Z3
+    Python API is kept, so that the model can be read without first
+    being converted to a string; the string representation is only
+    generated when it is first needed.
+    """
+    def __init__(self, z3Model):
+        """
+        Constructor for the Z3Model class.
+
+        @param z3Model Model object of the Z3 Python API.
+        """
+        super(Z3Model, self).__init__(None)
+
+        # Model object of the Z3 Python API, which is not kept when
+        # this Z3Model object is pickled.
+        self.z3Model = z3Model
+
+    def __str__(self):
+        """
+        Returns a string representation of this Z3Model object.
+
+        @retval String representation of this Z3Model object.
+        """
+        if self.modelStr is None:
+            self.modelStr = self.z3Model.sexpr()
+        return self.modelStr
+
+    def __getstate__(self):
+        """
+        Returns the pickled representation of a Z3Model object.
+
+        @retval Pickled representation of a Z3Model object.
+        """
+        objectDict = self.__dict__.copy()
+        objectDict["modelStr"] = str(self)
+        objectDict["z3Model"] = None
+        return objectDict
+
+
 class Z3Solver(Solver):
     """
     This class maintains a representation of Z3,
@@ -28,6 +70,11 @@ class Z3Solver(Solver):
         """Constructor for the Z3Solver class."""
         super(Z3Solver, self).__init__("z3")
 
+        # Underlying Z3 solver, which is created when the first query
+        # is checked and reused for later queries. Each query is checked
+        # within its own scope on this solver.
+        self._z3Solver = None
+
     def checkSat(self, query):
         """
         Checks and updates the satisfiability of the SMT query
@@ -38,14 +85,32 @@ class Z3Solver(Solver):
 
         @param query Query object that represents an SMT query.
         """
-        solver = z3.Solver()
-
         queryExpr = z3.parse_smt2_string(query.queryStr)
         if (not queryExpr.decl().kind() == z3.Z3_OP_AND or
             not queryExpr.children()[-1].decl().kind() == z3.Z3_OP_AND):
             errMsg = "SMT query is not in the form expected."
             raise GameTimeError(errMsg)
 
+        if self._z3Solver is None:
+            self._z3Solver = z3.Solver()
+        solver = self._z3Solver
+        solver.push()
+        try:
+            self._checkSat(solver, query, queryExpr)
+        finally:
+            # Remove the assertions of this query from the solver.
+            solver.pop()
+
+    def _checkSat(self, solver, query, queryExpr):
+        """
+        Checks and updates the satisfiability of the SMT query
+        represented by the Query object provided, using the scope
+        of the Z3 solver that has been opened for this query.
+
+        @param solver Z3 solver to assert the query on.
+        @param query Query object that represents an SMT query.
+        @param queryExpr Z3 expression parsed from the SMT query.
+        """
         # Assert all of the equivalences in the query.
         # (Ignore the last child of the `And' Boolean expression,
         # which is not an equivalence.)
@@ -59,7 +124,7 @@ class Z3Solver(Solver):
         # Check the satisfiability of the query.
         querySatResult = solver.check(*constraintVars)
         if querySatResult == z3.sat:
-            query.labelSat(Model(solver.model().sexpr()))
+            query.labelSat(Z3Model(solver.model()))
         elif querySatResult == z3.unsat:
             unsatCore = solver.unsat_core()
             unsatCore = [str(constraintVar) for constraintVar in unsatCore]
@@ -69,6 +134,26 @@ class Z3Solver(Solver):
         else:
             query.labelUnknown()
 
+    def __getstate__(self):
+        """
+        Returns the pickled representation of a Z3Solver object.
+
+        @retval Pickled representation of a Z3Solver object.
+        """
+        objectDict = self.__dict__.copy()
+        if "_z3Solver" in objectDict:
+            del objectDict["_z3Solver"]
+        return objectDict
+
+    def __setstate__(self, pickled):
+        """
+        Unpickles the provided pickled representation of a Z3Solver object.
+
+        @param pickled Pickled representation of a Z3Solver object.
+        """
+        self.__dict__.update(pickled)
+        self._z3Solver = None
+
     def __str__(self):
         """
         Returns a string representation of this Z3Solver object.